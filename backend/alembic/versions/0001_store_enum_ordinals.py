@@ -0,0 +1,72 @@
+"""Store transaction and agent types as integer ordinals
+
+Revision ID: 0001_store_enum_ordinals
+Revises: 
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_store_enum_ordinals'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Ordinals follow the enum declaration order (see app.models.types.OrdinalEnum)
+TRANSACTION_TYPES = ("INCOME", "EXPENSE")
+AGENT_TYPES = ("FINANCIAL_ANALYST", "RUNWAY_PREDICTOR", "INVESTMENT_ADVISOR", "ORCHESTRATOR")
+
+
+def _to_ordinal_case(column: str, names) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {i}" for i, name in enumerate(names, start=1))
+    return f"CASE {column} {whens} END"
+
+
+def _to_name_case(column: str, names) -> str:
+    whens = " ".join(f"WHEN {i} THEN '{name}'" for i, name in enumerate(names, start=1))
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    op.execute(f"UPDATE transactions SET type = {_to_ordinal_case('type', TRANSACTION_TYPES)}")
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column(
+            "type",
+            existing_type=sa.String(length=7),
+            type_=sa.SmallInteger(),
+            existing_nullable=False,
+            postgresql_using="type::smallint",
+        )
+    
+    op.execute(f"UPDATE agent_sessions SET agent_type = {_to_ordinal_case('agent_type', AGENT_TYPES)}")
+    with op.batch_alter_table("agent_sessions") as batch_op:
+        batch_op.alter_column(
+            "agent_type",
+            existing_type=sa.String(length=18),
+            type_=sa.SmallInteger(),
+            existing_nullable=False,
+            postgresql_using="agent_type::smallint",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("agent_sessions") as batch_op:
+        batch_op.alter_column(
+            "agent_type",
+            existing_type=sa.SmallInteger(),
+            type_=sa.String(length=18),
+            existing_nullable=False,
+        )
+    op.execute(f"UPDATE agent_sessions SET agent_type = {_to_name_case('agent_type', AGENT_TYPES)}")
+    
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column(
+            "type",
+            existing_type=sa.SmallInteger(),
+            type_=sa.String(length=7),
+            existing_nullable=False,
+        )
+    op.execute(f"UPDATE transactions SET type = {_to_name_case('type', TRANSACTION_TYPES)}")
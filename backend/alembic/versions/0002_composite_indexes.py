@@ -0,0 +1,30 @@
+"""Add composite indexes for per-company session and transaction lookups
+
+Revision ID: 0002_composite_indexes
+Revises: 0001_store_enum_ordinals
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_composite_indexes'
+down_revision = '0001_store_enum_ordinals'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_session_company_type_created",
+        "agent_sessions",
+        ["company_id", "agent_type", "created_at"],
+        postgresql_include=["status", "execution_time_ms", "token_count"],
+    )
+    op.create_index("ix_tx_company_date", "transactions", ["company_id", "date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tx_company_date", table_name="transactions")
+    op.drop_index("ix_session_company_type_created", table_name="agent_sessions")
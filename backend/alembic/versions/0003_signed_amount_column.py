@@ -0,0 +1,34 @@
+"""Store signed_amount as a generated column on transactions
+
+Revision ID: 0003_signed_amount_column
+Revises: 0002_composite_indexes
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_signed_amount_column'
+down_revision = '0002_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLite cannot add a stored generated column to a populated table,
+    # so batch mode rebuilds the table instead
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "signed_amount",
+                sa.Numeric(15, 2),
+                sa.Computed("CASE WHEN type = 1 THEN amount ELSE -amount END", persisted=True),
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_column("signed_amount")
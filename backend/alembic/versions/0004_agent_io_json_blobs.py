@@ -0,0 +1,42 @@
+"""Store agent session input/output as binary JSON blobs
+
+Revision ID: 0004_agent_io_json_blobs
+Revises: 0003_signed_amount_column
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_agent_io_json_blobs'
+down_revision = '0003_signed_amount_column'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ("input_data", "output_data")
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("agent_sessions") as batch_op:
+        for column in COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Text(),
+                type_=sa.LargeBinary(),
+                existing_nullable=True,
+                postgresql_using=f"convert_to({column}, 'UTF8')",
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("agent_sessions") as batch_op:
+        for column in COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.LargeBinary(),
+                type_=sa.Text(),
+                existing_nullable=True,
+                postgresql_using=f"convert_from({column}, 'UTF8')",
+            )
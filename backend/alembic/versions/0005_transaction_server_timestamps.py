@@ -0,0 +1,42 @@
+"""Stamp transaction timestamps on the server
+
+Revision ID: 0005_transaction_server_timestamps
+Revises: 0004_agent_io_json_blobs
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_transaction_server_timestamps'
+down_revision = '0004_agent_io_json_blobs'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ("created_at", "updated_at")
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        for column in COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                existing_nullable=False,
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        for column in COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                server_default=None,
+                existing_nullable=False,
+            )
@@ -0,0 +1,58 @@
+"""Store transaction amounts as integer cents
+
+Revision ID: 0006_amount_cents
+Revises: 0005_transaction_server_timestamps
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_amount_cents'
+down_revision = '0005_transaction_server_timestamps'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # signed_amount is generated from amount, so it is rebuilt on top of cents
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_column("signed_amount")
+        batch_op.add_column(sa.Column("amount_cents", sa.BigInteger(), nullable=True))
+    
+    op.execute("UPDATE transactions SET amount_cents = CAST(ROUND(amount * 100) AS BIGINT)")
+    
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("amount_cents", existing_type=sa.BigInteger(), nullable=False)
+        batch_op.drop_column("amount")
+        batch_op.add_column(
+            sa.Column(
+                "signed_amount",
+                sa.Numeric(15, 2),
+                sa.Computed(
+                    "CASE WHEN type = 1 THEN amount_cents ELSE -amount_cents END / 100.0",
+                    persisted=True,
+                ),
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_column("signed_amount")
+        batch_op.add_column(sa.Column("amount", sa.Numeric(15, 2), nullable=True))
+    
+    op.execute("UPDATE transactions SET amount = amount_cents / 100.0")
+    
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("amount", existing_type=sa.Numeric(15, 2), nullable=False)
+        batch_op.drop_column("amount_cents")
+        batch_op.add_column(
+            sa.Column(
+                "signed_amount",
+                sa.Numeric(15, 2),
+                sa.Computed("CASE WHEN type = 1 THEN amount ELSE -amount END", persisted=True),
+            )
+        )
@@ -12,6 +12,7 @@ from google.genai import types
 from app.config import settings
 from app.models.agent_session import AgentSession, AgentStatus, AgentType
 from app.database import get_async_session
+from app.services.memory_service import memory_service
 
 logger = logging.getLogger(__name__)
 
@@ -532,6 +533,7 @@ class BaseAgent(ABC):
                 self.agent_session_record.execution_time_ms = self._get_execution_time_ms()
                 
                 await db.commit()
+                memory_service.invalidate_company(self.company_id)
                 break
                 
         except Exception as e:
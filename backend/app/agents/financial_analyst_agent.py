@@ -183,7 +183,7 @@ Always base your analysis on the actual transaction data provided. Be specific w
         
         # Tools expect transactions to be in context
         transactions = tool_args.get("transactions", [])
-        initial_capital = tool_args.get("initial_capital", 0.0)
+        initial_capital = float(tool_args.get("initial_capital") or 0.0)
         
         if tool_name == "analyze_spending_by_category":
             period_months = tool_args.get("period_months")
@@ -247,7 +247,7 @@ Always base your analysis on the actual transaction data provided. Be specific w
             )
             
             # Calculate key metrics using tools
-            initial_capital = company_data.get("initial_capital", 0.0)
+            initial_capital = float(company_data.get("initial_capital") or 0.0)
             
             # 1. Category analysis
             category_analysis = financial_calculator.analyze_spending_by_category(
@@ -346,7 +346,7 @@ Always prioritize the company's financial stability and survival."""
                 }
             )
             
-            initial_capital = company_data.get("initial_capital", 0.0)
+            initial_capital = float(company_data.get("initial_capital") or 0.0)
             company_stage = self._infer_company_stage(company_data, transactions)
             
             # 1. Calculate current financial position
@@ -512,7 +512,7 @@ Prioritize liquidity and safety appropriate for a startup."""
     ) -> str:
         """Infer company stage from data."""
         # Simple heuristic based on initial capital and transaction volume
-        initial_capital = company_data.get("initial_capital", 0.0)
+        initial_capital = float(company_data.get("initial_capital") or 0.0)
         
         if initial_capital < 100000:
             return "seed"
@@ -1,12 +1,12 @@
 """Runway Predictor Agent for burn rate calculation and runway forecasting."""
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
 from app.agents.base_agent import BaseAgent
 from app.models.agent_session import AgentType
 from app.tools.financial_calculator import financial_calculator
-from app.tools.chart_generator import chart_generator
 
 logger = logging.getLogger(__name__)
 
@@ -189,10 +189,7 @@ Always include specific numbers, dates, and timeframes. Be clear about assumptio
         Returns:
             Tool execution results
         """
-        logger.info(
-            f"Executing tool: {tool_name}",
-            extra={"tool": tool_name, "args": tool_args}
-        )
+        logger.info("Executing tool: %s", tool_name)
         
         transactions = tool_args.get("transactions", [])
         
@@ -212,6 +209,8 @@ Always include specific numbers, dates, and timeframes. Be clear about assumptio
             )
         
         elif tool_name == "generate_runway_forecast":
+            from app.tools.chart_generator import chart_generator
+            
             current_balance = tool_args["current_balance"]
             monthly_burn_rate = tool_args["monthly_burn_rate"]
             forecast_months = tool_args.get("forecast_months", 12)
@@ -222,6 +221,8 @@ Always include specific numbers, dates, and timeframes. Be clear about assumptio
             )
         
         elif tool_name == "generate_burn_rate_chart":
+            from app.tools.chart_generator import chart_generator
+            
             months = tool_args.get("months", 12)
             return chart_generator.generate_burn_rate_chart(
                 transactions,
@@ -250,24 +251,14 @@ Always include specific numbers, dates, and timeframes. Be clear about assumptio
         """
         try:
             logger.info(
-                f"Starting runway prediction",
-                extra={
-                    "company_id": self.company_id,
-                    "transaction_count": len(transactions)
-                }
+                "Starting runway prediction company_id=%s n=%d",
+                self.company_id,
+                len(transactions)
             )
             
-            initial_capital = company_data.get("initial_capital", 0.0)
-            
-            # 1. Calculate burn rate
-            burn_rate_analysis = financial_calculator.calculate_burn_rate(
-                transactions,
-                period_months=3
-            )
+            initial_capital = float(company_data.get("initial_capital") or 0.0)
             
-            monthly_burn_rate = burn_rate_analysis.get("burn_rate", 0.0)
-            
-            # 2. Calculate current balance
+            # 1. Calculate current balance
             balance_info = financial_calculator.calculate_balance(
                 initial_capital,
                 transactions
@@ -275,46 +266,37 @@ Always include specific numbers, dates, and timeframes. Be clear about assumptio
             
             current_balance = balance_info.get("current_balance", 0.0)
             
-            # 3. Calculate runway
-            runway_info = financial_calculator.calculate_runway(
+            # 2. Calculate burn rate, runway, growth rates and health score
+            # from one parsed copy of the transactions (off the event loop)
+            dashboard = await asyncio.to_thread(
+                financial_calculator.calculate_dashboard,
+                transactions,
                 current_balance,
-                monthly_burn_rate
+                6,
+                3
             )
             
-            # 4. Generate forecast chart
+            burn_rate_analysis = dashboard.get("burn_rate", {})
+            monthly_burn_rate = burn_rate_analysis.get("burn_rate", 0.0)
+            runway_info = dashboard.get("runway", {})
+            health_score = dashboard.get("health_score", {})
+            
+            # 3. Generate forecast chart (chart tooling is imported on demand)
+            from app.tools.chart_generator import chart_generator
+            
             forecast_chart = chart_generator.generate_runway_forecast_chart(
                 current_balance,
                 monthly_burn_rate,
                 forecast_months=12
             )
             
-            # 5. Generate burn rate chart
+            # 4. Generate burn rate chart
             burn_rate_chart = chart_generator.generate_burn_rate_chart(
                 transactions,
                 months=12
             )
             
-            # 6. Calculate financial health score
-            income_growth = financial_calculator.calculate_growth_rate(
-                transactions,
-                metric="income",
-                period_months=6
-            )
-            
-            expense_growth = financial_calculator.calculate_growth_rate(
-                transactions,
-                metric="expense",
-                period_months=6
-            )
-            
-            health_score = financial_calculator.calculate_financial_health_score(
-                current_balance,
-                monthly_burn_rate,
-                income_growth.get("growth_rate", 0.0),
-                expense_growth.get("growth_rate", 0.0)
-            )
-            
-            # 7. Build context for LLM
+            # 5. Build context for LLM
             context = {
                 "company_name": company_data.get("name", "Your Company"),
                 "current_balance": current_balance,
@@ -326,7 +308,7 @@ Always include specific numbers, dates, and timeframes. Be clear about assumptio
                 "health_score": health_score
             }
             
-            # 8. Generate insights using LLM
+            # 6. Generate insights using LLM
             user_message = f"""Analyze the runway and burn rate for {context['company_name']} based on this data:
 
 RUNWAY STATUS: {runway_info.get('status', 'unknown').upper()}
@@ -364,7 +346,7 @@ Be specific about dates, amounts, and action items. If runway is critical, empha
             # Call the base execute method to get LLM insights
             llm_response = await self.execute(user_message, context)
             
-            # 9. Combine all results
+            # 7. Combine all results
             result = {
                 "agent_type": "runway_predictor",
                 "company_id": self.company_id,
@@ -388,20 +370,19 @@ Be specific about dates, amounts, and action items. If runway is critical, empha
             }
             
             logger.info(
-                f"Completed runway prediction",
-                extra={
-                    "company_id": self.company_id,
-                    "runway_months": runway_info.get("runway_months", 0),
-                    "status": runway_info.get("status", "unknown")
-                }
+                "Completed runway prediction company_id=%s runway_months=%s status=%s",
+                self.company_id,
+                runway_info.get("runway_months", 0),
+                runway_info.get("status", "unknown")
             )
             
             return result
             
         except Exception as e:
             logger.error(
-                f"Error in runway prediction",
-                extra={"company_id": self.company_id, "error": str(e)},
+                "Error in runway prediction company_id=%s: %s",
+                self.company_id,
+                e,
                 exc_info=True
             )
             raise
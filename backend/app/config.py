@@ -1,5 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
+from dataclasses import make_dataclass
 from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,9 +34,12 @@ class Settings(BaseSettings):
     # API Configuration
     api_v1_prefix: str = "/api/v1"
     cors_origins: List[str] = ["http://localhost:5173", "http://localhost:3000"]
+    skip_validation: bool = False  # Build DB-origin responses without re-validating
     
     # Session Configuration
     session_timeout: int = 3600
+    max_messages_per_session: int = 500
+    redis_url: str = ""  # Store sessions in Redis when set (e.g. redis://localhost:6379/0)
     
     # Logging
     log_level: str = "INFO"
@@ -57,3 +61,13 @@ class Settings(BaseSettings):
 # Global settings instance
 settings = Settings()
 
+# Frozen plain-attribute snapshot of the settings for hot paths (engine
+# setup, request handlers); mirrors every Settings field.
+SettingsSnapshot = make_dataclass(
+    "SettingsSnapshot",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+settings_snap = SettingsSnapshot(**settings.model_dump())
+
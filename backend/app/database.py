@@ -1,30 +1,67 @@
 """Database configuration and session management."""
 
 from typing import AsyncGenerator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from .config import settings
+from .config import settings_snap
 
 # Create declarative base for models
 Base = declarative_base()
 
 # Convert SQLite URL to async format if needed
-database_url = settings.database_url
+database_url = settings_snap.database_url
 if database_url.startswith("sqlite:///"):
     # Convert to async SQLite URL
     async_database_url = database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
 else:
     async_database_url = database_url
 
-# Create async engine
+# Per-connection SQLite tuning: WAL lets readers run alongside a writer,
+# synchronous=NORMAL drops the fsync on every commit (still durable in WAL mode)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to each new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# Connection pool sizing shared by both engines
+POOL_OPTIONS = {
+    "pool_size": 20,
+    "max_overflow": 40,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
+# Create async engine (aiosqlite defaults to NullPool, so request a real pool
+# to keep connections - and their pragmas - alive between requests)
 engine = create_async_engine(
     async_database_url,
-    echo=settings.environment == "development",
+    echo=settings_snap.environment == "development",
     future=True,
+    poolclass=AsyncAdaptedQueuePool if "sqlite" in async_database_url else None,
+    **POOL_OPTIONS,
     connect_args={"check_same_thread": False} if "sqlite" in async_database_url else {},
 )
 
+if "sqlite" in async_database_url:
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -35,13 +72,17 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 # Synchronous engine for migrations and seed data
-sync_database_url = settings.database_url
+sync_database_url = settings_snap.database_url
 sync_engine = create_engine(
     sync_database_url,
-    echo=settings.environment == "development",
+    echo=settings_snap.environment == "development",
+    **POOL_OPTIONS,
     connect_args={"check_same_thread": False} if "sqlite" in sync_database_url else {},
 )
 
+if "sqlite" in sync_database_url:
+    event.listen(sync_engine, "connect", _set_sqlite_pragmas)
+
 # Synchronous session factory
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -51,16 +92,37 @@ SessionLocal = sessionmaker(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async database sessions."""
+    """
+    Dependency for getting async database sessions.
+    
+    Does not commit: read-only handlers should not pay for a commit. Any
+    open transaction is rolled back when the session context exits.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_db_tx() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for write endpoints.
+    
+    Wraps the request in a transaction that commits on success and rolls
+    back if the handler raises.
+    """
     async with AsyncSessionLocal() as session:
-        try:
+        async with session.begin():
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get an async database session outside request handling (agents, services).
+    
+    Used as ``async for db in get_async_session()``; the session is closed
+    when the loop exits.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
 
 
 def get_sync_db() -> Session:
@@ -1,19 +1,20 @@
 """FastAPI application entry point for Cash Horizon."""
 
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timezone
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 import logging
 
-from .config import settings
+from .config import settings, settings_snap
 from .database import init_db, close_db
-from .models.schemas import HealthCheckResponse, ErrorResponse
+from .models.schemas import HealthCheckResponse
+from .utils import ORJSONResponse
 
 # Configure logging
 logging.basicConfig(
-    level=getattr(logging, settings.log_level),
+    level=getattr(logging, settings_snap.log_level),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
@@ -24,15 +25,15 @@ async def lifespan(app: FastAPI):
     """Lifecycle manager for FastAPI application."""
     # Startup
     logger.info("🚀 Starting Cash Horizon API...")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Database: {settings.database_url}")
+    logger.info("Environment: %s", settings_snap.environment)
+    logger.info("Database: %s", settings_snap.database_url)
     
     try:
         # Initialize database
         await init_db()
         logger.info("✅ Database initialized successfully")
     except Exception as e:
-        logger.error(f"❌ Failed to initialize database: {str(e)}")
+        logger.error("❌ Failed to initialize database: %s", e)
         raise
     
     yield
@@ -43,7 +44,7 @@ async def lifespan(app: FastAPI):
         await close_db()
         logger.info("✅ Database connections closed")
     except Exception as e:
-        logger.error(f"❌ Error closing database: {str(e)}")
+        logger.error("❌ Error closing database: %s", e)
 
 
 # Create FastAPI application
@@ -54,6 +55,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -71,13 +73,13 @@ app.add_middleware(
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "detail": str(exc) if settings.environment == "development" else "An unexpected error occurred",
-            "timestamp": datetime.utcnow().isoformat()
+            "detail": str(exc) if settings_snap.environment == "development" else "An unexpected error occurred",
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
 
@@ -89,8 +91,8 @@ async def health_check():
     """Health check endpoint."""
     return HealthCheckResponse(
         status="healthy",
-        version=settings.app_version,
-        timestamp=datetime.utcnow(),
+        version=settings_snap.app_version,
+        timestamp=time.time(),
         database="connected"
     )
 
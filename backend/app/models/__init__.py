@@ -1,13 +1,16 @@
 """Database models package."""
 
 from .company import Company
-from .transaction import Transaction, TransactionType
-from .agent_session import AgentSession, AgentType
+from .transaction import Transaction, TransactionType, TRANSACTION_SIGN, to_cents
+from .agent_session import AgentSession, AgentStatus, AgentType
 
 __all__ = [
     "Company",
     "Transaction",
     "TransactionType",
+    "TRANSACTION_SIGN",
+    "to_cents",
     "AgentSession",
+    "AgentStatus",
     "AgentType",
 ]
@@ -2,27 +2,46 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Text
+from sqlalchemy.orm import Mapped, relationship
 import enum
 from ..database import Base
+from .types import JSONBlob, OrdinalEnum
 
 if TYPE_CHECKING:
     from .company import Company
 
 
 class AgentType(str, enum.Enum):
-    """Agent type enum."""
+    """Agent type enum (stored as an ordinal - append new members only)."""
     FINANCIAL_ANALYST = "financial_analyst"
     RUNWAY_PREDICTOR = "runway_predictor"
     INVESTMENT_ADVISOR = "investment_advisor"
     ORCHESTRATOR = "orchestrator"
 
 
+class AgentStatus(str, enum.Enum):
+    """Agent session status (stored as its string value in the status column)."""
+    RUNNING = "running"
+    COMPLETED = "success"
+    FAILED = "failed"
+    PARTIAL = "partial"
+
+
 class AgentSession(Base):
     """Agent Session model for tracking agent executions and maintaining memory."""
     
     __tablename__ = "agent_sessions"
+    __table_args__ = (
+        # Serves the memory_service lookups (company + agent type, newest first)
+        Index(
+            "ix_session_company_type_created",
+            "company_id",
+            "agent_type",
+            "created_at",
+            postgresql_include=["status", "execution_time_ms", "token_count"]
+        ),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -32,23 +51,23 @@ class AgentSession(Base):
     
     # Session Information
     session_id = Column(String(255), nullable=False, index=True)
-    agent_type = Column(SQLEnum(AgentType), nullable=False, index=True)
+    agent_type = Column(OrdinalEnum(AgentType), nullable=False, index=True)
     
-    # Agent I/O Data (stored as JSON strings)
-    input_data = Column(Text, nullable=True)
-    output_data = Column(Text, nullable=True)
+    # Agent I/O Data (stored as orjson-encoded bytes, loaded as dicts)
+    input_data = Column(JSONBlob, nullable=True)
+    output_data = Column(JSONBlob, nullable=True)
     
     # Execution Metadata
     execution_time_ms = Column(Integer, nullable=True)  # Execution time in milliseconds
     token_count = Column(Integer, nullable=True)  # Tokens used by LLM
-    status = Column(String(50), nullable=True, default="success")  # success, failed, partial
+    status = Column(String(50), nullable=True, default=AgentStatus.COMPLETED.value)  # AgentStatus value
     error_message = Column(Text, nullable=True)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     
-    # Relationships
-    company: "Company" = relationship("Company", back_populates="agent_sessions")
+    # Relationships (never loaded implicitly; use selectinload() at the query site)
+    company: Mapped["Company"] = relationship("Company", back_populates="agent_sessions", lazy="raise")
     
     def __repr__(self) -> str:
         return (
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from typing import List, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, DateTime, Date, Numeric
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Date
+from sqlalchemy.orm import Mapped, relationship
 from ..database import Base
+from .types import FloatMoney
 
 if TYPE_CHECKING:
     from .transaction import Transaction
@@ -23,25 +24,25 @@ class Company(Base):
     name = Column(String(255), nullable=False, index=True)
     industry = Column(String(100), nullable=True)
     founded_date = Column(Date, nullable=True)
-    initial_capital = Column(Numeric(15, 2), nullable=True)
+    initial_capital = Column(FloatMoney, nullable=True)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
-    # Relationships
-    transactions: List["Transaction"] = relationship(
+    # Relationships (never loaded implicitly; use selectinload() at the query site)
+    transactions: Mapped[List["Transaction"]] = relationship(
         "Transaction",
         back_populates="company",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
     
-    agent_sessions: List["AgentSession"] = relationship(
+    agent_sessions: Mapped[List["AgentSession"]] = relationship(
         "AgentSession",
         back_populates="company",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
     
     def __repr__(self) -> str:
@@ -49,6 +50,11 @@ class Company(Base):
     
     @property
     def transaction_count(self) -> int:
-        """Get count of transactions for this company."""
+        """
+        Get count of transactions for this company.
+        
+        Requires ``transactions`` to have been loaded explicitly, e.g. with
+        ``select(Company).options(selectinload(Company.transactions))``.
+        """
         return len(self.transactions) if self.transactions else 0
 
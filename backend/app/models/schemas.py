@@ -1,11 +1,16 @@
 """Pydantic schemas for API request/response validation."""
 
 from datetime import datetime, date
-from typing import Optional, List
+from functools import cached_property
+from typing import Any, Dict, Optional, List
 from decimal import Decimal
-from pydantic import BaseModel, Field, ConfigDict
-from .transaction import TransactionType
-from .agent_session import AgentType
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, computed_field
+from ..config import settings_snap
+from .transaction import TRANSACTION_SIGN, Transaction, TransactionType
+from .agent_session import AgentSession, AgentType
+
+# Alias for fields named "date", whose name would otherwise shadow the type
+date_type = date
 
 
 # ============================================================================
@@ -56,7 +61,7 @@ class CompanyDetail(CompanyResponse):
 
 class TransactionBase(BaseModel):
     """Base schema for Transaction."""
-    date: date = Field(..., description="Transaction date")
+    date: date_type = Field(..., description="Transaction date")
     amount: Decimal = Field(..., gt=0, description="Transaction amount (always positive)")
     category: str = Field(..., min_length=1, max_length=100, description="Transaction category")
     type: TransactionType = Field(..., description="Transaction type (income or expense)")
@@ -70,7 +75,7 @@ class TransactionCreate(TransactionBase):
 
 class TransactionUpdate(BaseModel):
     """Schema for updating a transaction."""
-    date: Optional[date] = None
+    date: Optional[date_type] = None
     amount: Optional[Decimal] = Field(None, gt=0)
     category: Optional[str] = Field(None, min_length=1, max_length=100)
     type: Optional[TransactionType] = None
@@ -83,9 +88,41 @@ class TransactionResponse(TransactionBase):
     company_id: int
     created_at: datetime
     updated_at: datetime
-    signed_amount: float = Field(..., description="Amount with sign (negative for expenses)")
     
     model_config = ConfigDict(from_attributes=True)
+    
+    @computed_field(description="Amount with sign (negative for expenses)")
+    @cached_property
+    def signed_amount(self) -> float:
+        return TRANSACTION_SIGN[self.type] * float(self.amount)
+    
+    @classmethod
+    def from_row(cls, tx: Transaction) -> "TransactionResponse":
+        """
+        Build a response from a Transaction row.
+        
+        Rows coming from the database are already well-typed, so validation
+        is skipped when settings.skip_validation is enabled.
+        
+        Args:
+            tx: Transaction ORM instance
+            
+        Returns:
+            TransactionResponse
+        """
+        if not settings_snap.skip_validation:
+            return cls.model_validate(tx)
+        return cls.model_construct(
+            id=tx.id,
+            company_id=tx.company_id,
+            date=tx.date,
+            amount=tx.amount,
+            category=tx.category,
+            type=tx.type,
+            description=tx.description,
+            created_at=tx.created_at,
+            updated_at=tx.updated_at
+        )
 
 
 class TransactionBulkCreate(BaseModel):
@@ -117,6 +154,8 @@ class AgentSessionCreate(AgentSessionBase):
 class AgentSessionResponse(AgentSessionBase):
     """Schema for agent session response."""
     id: int
+    input_data: Optional[Dict[str, Any]] = Field(None, description="Input data")
+    output_data: Optional[Dict[str, Any]] = Field(None, description="Output data")
     company_id: int
     execution_time_ms: Optional[int]
     token_count: Optional[int]
@@ -126,6 +165,34 @@ class AgentSessionResponse(AgentSessionBase):
     execution_time_seconds: Optional[float]
     
     model_config = ConfigDict(from_attributes=True)
+    
+    @classmethod
+    def from_row(cls, session: AgentSession) -> "AgentSessionResponse":
+        """
+        Build a response from an AgentSession row.
+        
+        Args:
+            session: AgentSession ORM instance
+            
+        Returns:
+            AgentSessionResponse
+        """
+        if not settings_snap.skip_validation:
+            return cls.model_validate(session)
+        return cls.model_construct(
+            id=session.id,
+            company_id=session.company_id,
+            session_id=session.session_id,
+            agent_type=session.agent_type,
+            input_data=session.input_data,
+            output_data=session.output_data,
+            execution_time_ms=session.execution_time_ms,
+            token_count=session.token_count,
+            status=session.status,
+            error_message=session.error_message,
+            created_at=session.created_at,
+            execution_time_seconds=session.execution_time_seconds
+        )
 
 
 # ============================================================================
@@ -142,7 +209,7 @@ class FinancialAnalysisRequest(BaseModel):
 class CategorySpending(BaseModel):
     """Category spending breakdown."""
     category: str
-    total_amount: Decimal
+    total_amount: float
     transaction_count: int
     percentage: float
 
@@ -154,9 +221,9 @@ class FinancialAnalysisResponse(BaseModel):
     timestamp: datetime
     
     # Financial Metrics
-    total_income: Decimal
-    total_expenses: Decimal
-    net_balance: Decimal
+    total_income: float
+    total_expenses: float
+    net_balance: float
     
     # Category Breakdown
     spending_by_category: List[CategorySpending]
@@ -172,6 +239,14 @@ class RunwayPredictionRequest(BaseModel):
     forecast_months: int = Field(12, ge=1, le=60, description="Number of months to forecast")
 
 
+class ForecastSeries(BaseModel):
+    """Monthly forecast stored column-wise (one list per series)."""
+    months: List[str] = Field(..., description="Forecast months (YYYY-MM)")
+    balance: List[float]
+    income: List[float]
+    expenses: List[float]
+
+
 class RunwayPredictionResponse(BaseModel):
     """Response schema for runway prediction."""
     company_id: int
@@ -179,13 +254,13 @@ class RunwayPredictionResponse(BaseModel):
     timestamp: datetime
     
     # Runway Metrics
-    monthly_burn_rate: Decimal = Field(..., description="Average monthly burn rate")
-    current_balance: Decimal
+    monthly_burn_rate: float = Field(..., description="Average monthly burn rate")
+    current_balance: float
     runway_months: Optional[float] = Field(None, description="Months until runway ends")
     runway_date: Optional[date] = Field(None, description="Estimated date when runway ends")
     
     # Forecast Data
-    forecast_data: List[dict] = Field(..., description="Monthly forecast data for charts")
+    forecast: ForecastSeries = Field(..., description="Monthly forecast series for charts")
     
     # Insights
     insights: str = Field(..., description="Natural language insights from agent")
@@ -216,7 +291,7 @@ class InvestmentRecommendationResponse(BaseModel):
     
     # Financial Health
     can_invest: bool = Field(..., description="Whether company is in position to invest")
-    current_balance: Decimal
+    current_balance: float
     
     # Recommendations
     recommendations: List[InvestmentOption] = Field([], description="Investment options")
@@ -233,7 +308,7 @@ class HealthCheckResponse(BaseModel):
     """Health check response."""
     status: str = "healthy"
     version: str
-    timestamp: datetime
+    timestamp: float = Field(..., description="Unix timestamp (seconds, UTC)")
     database: str = "connected"
 
 
@@ -254,3 +329,32 @@ class SuccessResponse(BaseModel):
 # Forward reference resolution
 CompanyDetail.model_rebuild()
 
+
+# ============================================================================
+# Cached Serializers
+# ============================================================================
+
+# Built once at import so hot response paths reuse the compiled serializers
+_CATEGORY_LIST_ADAPTER = TypeAdapter(List[CategorySpending])
+_FIN_ADAPTER = TypeAdapter(FinancialAnalysisResponse)
+
+
+def dump_categories(categories: List[CategorySpending]) -> bytes:
+    """Serialize a category breakdown list to JSON bytes."""
+    return _CATEGORY_LIST_ADAPTER.dump_json(categories)
+
+
+def dump_financial(analysis: FinancialAnalysisResponse) -> bytes:
+    """
+    Serialize a financial analysis response to JSON bytes.
+    
+    Handlers can wrap the result in Response(media_type="application/json")
+    without going through jsonable_encoder.
+    
+    Args:
+        analysis: Financial analysis response
+        
+    Returns:
+        JSON-encoded bytes
+    """
+    return _FIN_ADAPTER.dump_json(analysis)
@@ -1,26 +1,48 @@
 """Transaction model for database."""
 
-from datetime import datetime
-from typing import TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, DateTime, Date, Numeric, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from decimal import Decimal, ROUND_HALF_UP
+from typing import TYPE_CHECKING, Optional, Union
+from sqlalchemy import BigInteger, Column, Computed, Integer, String, DateTime, Date, ForeignKey, Index, func
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, relationship
 import enum
 from ..database import Base
+from .types import FloatMoney, OrdinalEnum
 
 if TYPE_CHECKING:
     from .company import Company
 
 
 class TransactionType(str, enum.Enum):
-    """Transaction type enum."""
+    """Transaction type enum (stored as an ordinal - append new members only)."""
     INCOME = "income"
     EXPENSE = "expense"
 
 
+# Sign multiplier per transaction type (income adds, expense subtracts)
+TRANSACTION_SIGN = {
+    TransactionType.INCOME: 1.0,
+    TransactionType.EXPENSE: -1.0,
+}
+
+
+def to_cents(amount: Union[Decimal, float, int, str]) -> int:
+    """Convert a currency amount to integer cents (half-up rounding)."""
+    return int((Decimal(str(amount)) * 100).to_integral_value(ROUND_HALF_UP))
+
+
 class Transaction(Base):
     """Transaction model representing financial transactions."""
     
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Per-company listings ordered or filtered by date
+        Index("ix_tx_company_date", "company_id", "date"),
+    )
+    # Fetch server-generated columns back (RETURNING) after UPDATEs too, so
+    # reading signed_amount or updated_at after a flush never lazy-loads
+    # (which fails under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -30,27 +52,43 @@ class Transaction(Base):
     
     # Transaction Details
     date = Column(Date, nullable=False, index=True)
-    amount = Column(Numeric(15, 2), nullable=False)
+    amount_cents = Column(BigInteger, nullable=False)
     category = Column(String(100), nullable=False, index=True)
-    type = Column(SQLEnum(TransactionType), nullable=False, index=True)
+    type = Column(OrdinalEnum(TransactionType), nullable=False, index=True)
     description = Column(String(500), nullable=True)
     
-    # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Amount with sign (negative for expenses), computed by the database on write;
+    # type 1 is the INCOME ordinal
+    signed_amount = Column(
+        FloatMoney,
+        Computed("CASE WHEN type = 1 THEN amount_cents ELSE -amount_cents END / 100.0", persisted=True)
+    )
+    
+    # Metadata (stamped by the database)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
-    # Relationships
-    company: "Company" = relationship("Company", back_populates="transactions")
+    # Relationships (never loaded implicitly; use selectinload() at the query site)
+    company: Mapped["Company"] = relationship("Company", back_populates="transactions", lazy="raise")
+    
+    @hybrid_property
+    def amount(self) -> Optional[float]:
+        """Amount in currency units (stored as integer cents)."""
+        if self.amount_cents is None:
+            return None
+        return self.amount_cents / 100
+    
+    @amount.inplace.setter
+    def _amount_setter(self, value: Union[Decimal, float, int, str]) -> None:
+        self.amount_cents = to_cents(value)
+    
+    @amount.inplace.expression
+    @classmethod
+    def _amount_expression(cls):
+        return cls.amount_cents / 100.0
     
     def __repr__(self) -> str:
         return (
             f"<Transaction(id={self.id}, company_id={self.company_id}, "
             f"date={self.date}, amount={self.amount}, type={self.type.value})>"
         )
-    
-    @property
-    def signed_amount(self) -> float:
-        """Get amount with sign based on transaction type."""
-        amount_float = float(self.amount)
-        return amount_float if self.type == TransactionType.INCOME else -amount_float
-
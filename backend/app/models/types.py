@@ -0,0 +1,93 @@
+"""Custom SQLAlchemy column types shared by the models."""
+
+import enum
+from typing import Any, Optional, Type
+
+import orjson
+from sqlalchemy import LargeBinary, Numeric, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class OrdinalEnum(TypeDecorator):
+    """
+    Store a Python enum as a small integer ordinal.
+    
+    The ordinal is the 1-based position of the member in the enum's
+    declaration order, so new members must only ever be appended. Python
+    code keeps working with the enum members (and their string values).
+    """
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class: Type[enum.Enum], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._ordinals = {member: i for i, member in enumerate(self._members, start=1)}
+    
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._ordinals[self.enum_class(value)]
+    
+    def process_result_value(self, value, dialect) -> Optional[enum.Enum]:
+        if value is None:
+            return None
+        return self._members[value - 1]
+    
+    @property
+    def python_type(self):
+        return self.enum_class
+
+
+class FloatMoney(TypeDecorator):
+    """
+    Money column stored as ``Numeric(15, 2)`` but returned as ``float``.
+    
+    Avoids handing ``Decimal`` values to the float-based calculators, where
+    mixed Decimal/float arithmetic is slow (or raises TypeError).
+    """
+    
+    impl = Numeric(15, 2)
+    cache_ok = True
+    
+    def process_result_value(self, value, dialect) -> Optional[float]:
+        if value is None:
+            return None
+        return float(value)
+    
+    @property
+    def python_type(self):
+        return float
+
+
+class JSONBlob(TypeDecorator):
+    """
+    JSON document stored as raw orjson bytes.
+    
+    Python values are encoded on write and decoded straight from bytes on
+    read, with no intermediate text column. ``str``/``bytes`` values are
+    treated as already-encoded JSON and stored as-is.
+    """
+    
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, str):
+            return value.encode()
+        return orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    
+    def process_result_value(self, value, dialect) -> Any:
+        if value is None:
+            return None
+        return orjson.loads(value)
+    
+    @property
+    def python_type(self):
+        return dict
@@ -1,12 +1,26 @@
 """Business logic and services"""
 
-from app.services.session_service import session_service, InMemorySessionService
-from app.services.memory_service import memory_service, MemoryService
+from importlib import import_module
 
-__all__ = [
-    "session_service",
-    "InMemorySessionService",
-    "memory_service",
-    "MemoryService"
-]
+# Services are resolved on first attribute access so that importing one
+# service (e.g. app.services.transaction_service) does not pull in the others.
+_EXPORTS = {
+    "session_service": "app.services.session_service",
+    "InMemorySessionService": "app.services.session_service",
+    "RedisSessionService": "app.services.redis_session_service",
+    "memory_service": "app.services.memory_service",
+    "MemoryService": "app.services.memory_service",
+    "transaction_service": "app.services.transaction_service",
+    "TransactionService": "app.services.transaction_service"
+}
 
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Lazily import and cache service exports."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -1,10 +1,14 @@
 """Memory service for long-term storage of agent insights."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import operator
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_, desc, exists, func, case, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.agent_session import AgentSession, AgentStatus, AgentType
@@ -12,6 +16,25 @@ from app.database import get_async_session
 
 logger = logging.getLogger(__name__)
 
+# AgentSession columns copied into each insight dict, in output order
+_INSIGHT_ATTRS = (
+    "session_id",
+    "agent_type",
+    "created_at",
+    "input_data",
+    "output_data",
+    "execution_time_ms",
+    "token_count"
+)
+_INSIGHT_GET = operator.attrgetter(*_INSIGHT_ATTRS)
+_INSIGHT_KEYS = tuple(sys.intern(k) for k in _INSIGHT_ATTRS)
+
+# Seconds a get_recent_insights result is reused for the same arguments
+INSIGHT_CACHE_TTL = 30.0
+
+# Maximum number of get_recent_insights results kept at once
+INSIGHT_CACHE_SIZE = 256
+
 
 class MemoryService:
     """
@@ -26,6 +49,113 @@ class MemoryService:
     Uses the AgentSession database table for persistent storage.
     """
     
+    def __init__(self):
+        """Initialize the service with an empty insight cache."""
+        # Entries are kept in insertion order, which is also expiry order
+        self._insight_cache: "OrderedDict[tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+    
+    def invalidate_company(self, company_id: int) -> None:
+        """
+        Drop cached insights for a company.
+        
+        Called whenever an agent session for the company is written.
+        
+        Args:
+            company_id: ID of the company
+        """
+        for key in [k for k in self._insight_cache if k[0] == company_id]:
+            del self._insight_cache[key]
+    
+    def _cached_insights(self, cache_key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up a cached get_recent_insights result, dropping it if expired.
+        
+        Args:
+            cache_key: (company_id, agent_type, limit) of the call
+            
+        Returns:
+            Copy of the cached insights, or None on a miss
+        """
+        cached = self._insight_cache.get(cache_key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] < INSIGHT_CACHE_TTL:
+            return list(cached[1])
+        del self._insight_cache[cache_key]
+        return None
+    
+    def _store_insights(self, cache_key: tuple, insights: List[Dict[str, Any]]) -> None:
+        """
+        Cache a get_recent_insights result.
+        
+        Expired entries are dropped first, then the oldest entries until the
+        cache is within INSIGHT_CACHE_SIZE.
+        
+        Args:
+            cache_key: (company_id, agent_type, limit) of the call
+            insights: Insights returned for that call
+        """
+        now = time.monotonic()
+        cache = self._insight_cache
+        while cache and now - next(iter(cache.values()))[0] >= INSIGHT_CACHE_TTL:
+            cache.popitem(last=False)
+        
+        cache.pop(cache_key, None)
+        cache[cache_key] = (now, insights)
+        while len(cache) > INSIGHT_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    async def iter_recent_insights(
+        self,
+        company_id: int,
+        agent_type: Optional[AgentType] = None,
+        limit: int = 10
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream recent agent insights for a company, newest first.
+        
+        Rows are fetched through a server-side cursor so callers never
+        hold the full result set in memory.
+        
+        Args:
+            company_id: ID of the company
+            agent_type: Optional filter by agent type
+            limit: Maximum number of insights to yield
+            
+        Yields:
+            Insight dictionaries
+        """
+        async for db in get_async_session():
+            # Build query (lambda statements cache their compiled SQL, so
+            # only the bound values change between calls)
+            query = lambda_stmt(lambda: select(AgentSession).where(
+                and_(
+                    AgentSession.company_id == company_id,
+                    AgentSession.status == AgentStatus.COMPLETED
+                )
+            ))
+            
+            # Filter by agent type if provided
+            if agent_type:
+                query += lambda q: q.where(AgentSession.agent_type == agent_type)
+            
+            # Order by most recent and limit
+            query += lambda q: q.order_by(desc(AgentSession.created_at)).limit(limit)
+            
+            result = await db.stream_scalars(query)
+            async for session in result:
+                (session_id, agent_type_, created_at, input_data,
+                 output_data, execution_time_ms, token_count) = _INSIGHT_GET(session)
+                yield dict(zip(_INSIGHT_KEYS, (
+                    session_id,
+                    agent_type_.value,
+                    created_at.isoformat(),
+                    input_data,
+                    output_data,
+                    execution_time_ms,
+                    token_count
+                )))
+    
     async def get_recent_insights(
         self,
         company_id: int,
@@ -43,51 +173,32 @@ class MemoryService:
         Returns:
             List of insight dictionaries
         """
+        cache_key = (company_id, agent_type, limit)
+        cached = self._cached_insights(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            async for db in get_async_session():
-                # Build query
-                query = select(AgentSession).where(
-                    and_(
-                        AgentSession.company_id == company_id,
-                        AgentSession.status == AgentStatus.COMPLETED
-                    )
-                )
-                
-                # Filter by agent type if provided
-                if agent_type:
-                    query = query.where(AgentSession.agent_type == agent_type)
-                
-                # Order by most recent and limit
-                query = query.order_by(desc(AgentSession.created_at)).limit(limit)
-                
-                # Execute query
-                result = await db.execute(query)
-                sessions = result.scalars().all()
-                
-                # Format results
-                insights = []
-                for session in sessions:
-                    insights.append({
-                        "session_id": session.session_id,
-                        "agent_type": session.agent_type.value,
-                        "created_at": session.created_at.isoformat(),
-                        "input_data": session.input_data,
-                        "output_data": session.output_data,
-                        "execution_time_ms": session.execution_time_ms,
-                        "token_count": session.token_count
-                    })
-                
-                logger.info(
-                    f"Retrieved {len(insights)} insights for company {company_id}",
-                    extra={
-                        "company_id": company_id,
-                        "agent_type": agent_type.value if agent_type else "all",
-                        "count": len(insights)
-                    }
+            insights = [
+                insight async for insight in self.iter_recent_insights(
+                    company_id=company_id,
+                    agent_type=agent_type,
+                    limit=limit
                 )
-                
-                return insights
-                
+            ]
+            
+            logger.info(
+                f"Retrieved {len(insights)} insights for company {company_id}",
+                extra={
+                    "company_id": company_id,
+                    "agent_type": agent_type.value if agent_type else "all",
+                    "count": len(insights)
+                }
+            )
+            
+            self._store_insights(cache_key, insights)
+            return list(insights)
+            
         except Exception as e:
             logger.error(
                 f"Error retrieving insights",
@@ -149,12 +260,11 @@ class MemoryService:
                     )
                 ).order_by(AgentSession.created_at)
                 
-                result = await db.execute(query)
-                sessions = result.scalars().all()
+                result = await db.stream_scalars(query)
                 
                 # Extract key metrics over time
                 trends = []
-                for session in sessions:
+                async for session in result:
                     trends.append({
                         "timestamp": session.created_at.isoformat(),
                         "output_data": session.output_data
@@ -183,6 +293,29 @@ class MemoryService:
             )
             return []
     
+    async def has_sessions(
+        self,
+        company_id: int,
+        agent_type: Optional[AgentType] = None
+    ) -> bool:
+        """
+        Check whether a company has any agent sessions recorded.
+        
+        Args:
+            company_id: ID of the company
+            agent_type: Optional filter by agent type
+            
+        Returns:
+            True if at least one session exists
+        """
+        condition = AgentSession.company_id == company_id
+        if agent_type:
+            condition = and_(condition, AgentSession.agent_type == agent_type)
+        
+        async for db in get_async_session():
+            return bool(await db.scalar(select(exists().where(condition))))
+        return False
+    
     async def build_context_from_memory(
         self,
         company_id: int,
@@ -199,12 +332,22 @@ class MemoryService:
             Context dictionary with historical insights
         """
         try:
-            # Get recent insights
-            recent_insights = await self.get_recent_insights(
-                company_id=company_id,
-                agent_type=agent_type,
-                limit=5
-            )
+            # A cached result (including a cached cold start) needs no query
+            cache_key = (company_id, agent_type, 5)
+            recent_insights = self._cached_insights(cache_key)
+            if recent_insights is None:
+                if await self.has_sessions(company_id, agent_type):
+                    # Get recent insights
+                    recent_insights = await self.get_recent_insights(
+                        company_id=company_id,
+                        agent_type=agent_type,
+                        limit=5
+                    )
+                else:
+                    # Cold-start companies have nothing to fetch; skip the
+                    # sorted query and remember the empty result
+                    recent_insights = []
+                    self._store_insights(cache_key, recent_insights)
             
             # Build context
             context = {
@@ -254,8 +397,18 @@ class MemoryService:
             async for db in get_async_session():
                 cutoff_date = datetime.utcnow() - timedelta(days=days)
                 
-                # Build query
-                query = select(AgentSession).where(
+                # Aggregate in the database; only a single row comes back
+                query = select(
+                    func.count().label("total"),
+                    func.coalesce(func.sum(AgentSession.execution_time_ms), 0).label("execution_time_ms"),
+                    func.coalesce(func.sum(AgentSession.token_count), 0).label("token_count"),
+                    func.coalesce(
+                        func.sum(case((AgentSession.status == AgentStatus.COMPLETED, 1), else_=0)), 0
+                    ).label("completed"),
+                    func.coalesce(
+                        func.sum(case((AgentSession.status == AgentStatus.FAILED, 1), else_=0)), 0
+                    ).label("failed")
+                ).where(
                     AgentSession.created_at >= cutoff_date
                 )
                 
@@ -266,19 +419,19 @@ class MemoryService:
                     query = query.where(AgentSession.agent_type == agent_type)
                 
                 result = await db.execute(query)
-                sessions = result.scalars().all()
+                row = result.one()
                 
                 # Calculate metrics
-                total_executions = len(sessions)
-                completed = sum(1 for s in sessions if s.status == AgentStatus.COMPLETED)
-                failed = sum(1 for s in sessions if s.status == AgentStatus.FAILED)
+                total_executions = row.total
+                completed = row.completed
+                failed = row.failed
                 
                 avg_execution_time = (
-                    sum(s.execution_time_ms for s in sessions) / total_executions
+                    row.execution_time_ms / total_executions
                     if total_executions > 0 else 0
                 )
                 
-                total_tokens = sum(s.token_count for s in sessions)
+                total_tokens = row.token_count
                 
                 metrics = {
                     "period_days": days,
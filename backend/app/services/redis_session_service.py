@@ -0,0 +1,428 @@
+"""Redis-backed session service for agent conversations."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    logger.warning("Redis client not installed. Install with: pip install redis")
+
+from app.config import settings
+
+# Index of every session ID; entries whose keys have expired are pruned lazily
+ALL_SESSIONS_KEY = "sessions:all"
+
+
+class RedisSessionService:
+    """
+    Redis-backed session service with the same interface as
+    InMemorySessionService.
+    
+    Each session is stored under three keys that share a TTL refreshed on
+    every access, so Redis evicts idle sessions on its own:
+    - session:{id}           hash of session fields
+    - session:{id}:messages  capped list of JSON-encoded messages
+    - session:{id}:context   hash of JSON-encoded context values
+    
+    Per-company sets (sessions:company:{cid}) index sessions for
+    get_active_sessions.
+    """
+    
+    def __init__(self, url: Optional[str] = None, client: Optional[Any] = None):
+        """
+        Initialize the Redis session service.
+        
+        Args:
+            url: Redis connection URL (or uses settings.redis_url)
+            client: Optional pre-built Redis client (takes precedence over url)
+        """
+        self._client = client or redis.Redis.from_url(
+            url or settings.redis_url,
+            decode_responses=True
+        )
+        self._session_timeout = settings.session_timeout
+        self._max_messages = settings.max_messages_per_session
+    
+    @staticmethod
+    def _keys(session_id: str) -> tuple:
+        """Get the (session, messages, context) keys for a session."""
+        key = f"session:{session_id}"
+        return key, f"{key}:messages", f"{key}:context"
+    
+    @staticmethod
+    def _company_key(company_id: Any) -> str:
+        """Get the session index key for a company."""
+        return f"sessions:company:{company_id}"
+    
+    def _touch(self, session_id: str) -> bool:
+        """
+        Refresh a session's TTL.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            True if the session exists, False otherwise
+        """
+        key, messages_key, context_key = self._keys(session_id)
+        pipe = self._client.pipeline(transaction=False)
+        pipe.expire(key, self._session_timeout)
+        pipe.expire(messages_key, self._session_timeout)
+        pipe.expire(context_key, self._session_timeout)
+        exists, _, _ = pipe.execute()
+        return bool(exists)
+    
+    def create_session(
+        self,
+        session_id: str,
+        company_id: int,
+        agent_type: str,
+        initial_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a new session.
+        
+        Args:
+            session_id: Unique session identifier
+            company_id: ID of the company
+            agent_type: Type of agent (analyst, runway, investment)
+            initial_context: Optional initial context data
+            
+        Returns:
+            Created session dictionary
+        """
+        created_at = datetime.utcnow()
+        context = initial_context or {}
+        key, messages_key, context_key = self._keys(session_id)
+        previous_company_id = self._client.hget(key, "company_id")
+        
+        pipe = self._client.pipeline()
+        pipe.delete(key, messages_key, context_key)
+        if previous_company_id is not None:
+            pipe.srem(self._company_key(previous_company_id), session_id)
+        pipe.hset(key, mapping={
+            "session_id": session_id,
+            "company_id": company_id,
+            "agent_type": agent_type,
+            "created_at": created_at.isoformat(),
+            "metadata": "{}"
+        })
+        pipe.expire(key, self._session_timeout)
+        if context:
+            pipe.hset(context_key, mapping={k: orjson.dumps(v) for k, v in context.items()})
+            pipe.expire(context_key, self._session_timeout)
+        pipe.sadd(self._company_key(company_id), session_id)
+        pipe.sadd(ALL_SESSIONS_KEY, session_id)
+        pipe.execute()
+        
+        logger.info(
+            f"Created session {session_id}",
+            extra={
+                "session_id": session_id,
+                "company_id": company_id,
+                "agent_type": agent_type
+            }
+        )
+        
+        return {
+            "session_id": session_id,
+            "company_id": company_id,
+            "agent_type": agent_type,
+            "created_at": created_at,
+            "last_accessed_epoch": time.time(),
+            "messages": [],
+            "context": context,
+            "metadata": {}
+        }
+    
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a session by ID, refreshing its TTL.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Session dictionary or None if not found or expired
+        """
+        key, messages_key, context_key = self._keys(session_id)
+        
+        # Read and refresh in one round trip
+        pipe = self._client.pipeline(transaction=False)
+        pipe.hgetall(key)
+        pipe.lrange(messages_key, 0, -1)
+        pipe.hgetall(context_key)
+        pipe.expire(key, self._session_timeout)
+        pipe.expire(messages_key, self._session_timeout)
+        pipe.expire(context_key, self._session_timeout)
+        fields, messages, context, _, _, _ = pipe.execute()
+        
+        if not fields:
+            return None
+        
+        return {
+            "session_id": fields["session_id"],
+            "company_id": int(fields["company_id"]),
+            "agent_type": fields["agent_type"],
+            "created_at": datetime.fromisoformat(fields["created_at"]),
+            "last_accessed_epoch": time.time(),
+            "messages": [orjson.loads(m) for m in messages],
+            "context": {k: orjson.loads(v) for k, v in context.items()},
+            "metadata": orjson.loads(fields["metadata"])
+        }
+    
+    def add_message(
+        self,
+        session_id: str,
+        role: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Add a message to the session history.
+        
+        Args:
+            session_id: Session identifier
+            role: Message role (user, assistant, system)
+            content: Message content
+            metadata: Optional message metadata
+            
+        Returns:
+            True if message was added, False if session not found
+        """
+        if not self._touch(session_id):
+            logger.warning(f"Session {session_id} not found for adding message")
+            return False
+        
+        message = orjson.dumps({
+            "role": role,
+            "content": content,
+            "timestamp_ms": time.time_ns() // 1_000_000,
+            "metadata": metadata or {}
+        })
+        
+        _, messages_key, _ = self._keys(session_id)
+        pipe = self._client.pipeline()
+        pipe.rpush(messages_key, message)
+        pipe.ltrim(messages_key, -self._max_messages, -1)
+        pipe.expire(messages_key, self._session_timeout)
+        message_count = pipe.execute()[0]
+        
+        logger.debug(
+            f"Added message to session {session_id}",
+            extra={
+                "session_id": session_id,
+                "role": role,
+                "message_count": min(message_count, self._max_messages)
+            }
+        )
+        
+        return True
+    
+    def get_messages(
+        self,
+        session_id: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get message history for a session.
+        
+        Args:
+            session_id: Session identifier
+            limit: Optional limit on number of messages (most recent)
+            
+        Returns:
+            List of messages (empty if session not found)
+        """
+        if not self._touch(session_id):
+            return []
+        
+        _, messages_key, _ = self._keys(session_id)
+        start = -limit if limit else 0
+        return [orjson.loads(m) for m in self._client.lrange(messages_key, start, -1)]
+    
+    def update_context(
+        self,
+        session_id: str,
+        context_updates: Dict[str, Any]
+    ) -> bool:
+        """
+        Update the session context.
+        
+        Args:
+            session_id: Session identifier
+            context_updates: Dictionary of context updates to merge
+            
+        Returns:
+            True if context was updated, False if session not found
+        """
+        if not self._touch(session_id):
+            logger.warning(f"Session {session_id} not found for context update")
+            return False
+        
+        if context_updates:
+            _, _, context_key = self._keys(session_id)
+            pipe = self._client.pipeline()
+            pipe.hset(context_key, mapping={
+                k: orjson.dumps(v) for k, v in context_updates.items()
+            })
+            pipe.expire(context_key, self._session_timeout)
+            pipe.execute()
+        
+        logger.debug(
+            f"Updated context for session {session_id}",
+            extra={
+                "session_id": session_id,
+                "context_keys": list(context_updates.keys())
+            }
+        )
+        
+        return True
+    
+    def get_context(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get the session context.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Context dictionary (empty if session not found)
+        """
+        if not self._touch(session_id):
+            return {}
+        
+        _, _, context_key = self._keys(session_id)
+        return {
+            k: orjson.loads(v)
+            for k, v in self._client.hgetall(context_key).items()
+        }
+    
+    def delete_session(self, session_id: str) -> bool:
+        """
+        Delete a session.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            True if session was deleted, False if not found
+        """
+        key, messages_key, context_key = self._keys(session_id)
+        company_id = self._client.hget(key, "company_id")
+        
+        pipe = self._client.pipeline()
+        pipe.delete(key, messages_key, context_key)
+        if company_id is not None:
+            pipe.srem(self._company_key(company_id), session_id)
+        pipe.srem(ALL_SESSIONS_KEY, session_id)
+        deleted = pipe.execute()[0]
+        
+        if company_id is not None and deleted:
+            logger.info(f"Deleted session {session_id}")
+            return True
+        
+        return False
+    
+    def cleanup_expired_sessions(self) -> int:
+        """
+        Remove all expired sessions.
+        
+        Redis evicts expired session keys itself, so there is nothing to do;
+        stale index entries are pruned by get_active_sessions and get_stats.
+        
+        Returns:
+            Number of sessions removed (always 0)
+        """
+        return 0
+    
+    def _live_summaries(self, index_key: str) -> List[Dict[str, Any]]:
+        """
+        Load summaries for the sessions in an index set, pruning expired IDs.
+        
+        Args:
+            index_key: Redis set of session IDs
+            
+        Returns:
+            List of session summaries for sessions that still exist
+        """
+        session_ids = list(self._client.smembers(index_key))
+        if not session_ids:
+            return []
+        
+        pipe = self._client.pipeline(transaction=False)
+        for session_id in session_ids:
+            key, messages_key, _ = self._keys(session_id)
+            pipe.hmget(key, "company_id", "agent_type", "created_at")
+            pipe.ttl(key)
+            pipe.llen(messages_key)
+        results = pipe.execute()
+        
+        now = time.time()
+        summaries = []
+        stale = []
+        
+        for i, session_id in enumerate(session_ids):
+            (company_id, agent_type, created_at), ttl, message_count = results[3 * i:3 * i + 3]
+            if company_id is None:
+                stale.append(session_id)
+                continue
+            
+            # The TTL is reset to the full timeout on each access
+            last_accessed = now - (self._session_timeout - max(ttl, 0))
+            summaries.append({
+                "session_id": session_id,
+                "company_id": int(company_id),
+                "agent_type": agent_type,
+                "created_at": datetime.fromisoformat(created_at),
+                "last_accessed": datetime.utcfromtimestamp(last_accessed),
+                "message_count": message_count
+            })
+        
+        if stale:
+            self._client.srem(index_key, *stale)
+        
+        return summaries
+    
+    def get_active_sessions(self, company_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get all active sessions, optionally filtered by company.
+        
+        Args:
+            company_id: Optional company ID to filter by
+            
+        Returns:
+            List of active session summaries
+        """
+        index_key = ALL_SESSIONS_KEY if company_id is None else self._company_key(company_id)
+        return self._live_summaries(index_key)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about current sessions.
+        
+        Returns:
+            Dictionary of session statistics
+        """
+        sessions = self._live_summaries(ALL_SESSIONS_KEY)
+        total_sessions = len(sessions)
+        total_messages = sum(session["message_count"] for session in sessions)
+        
+        return {
+            "total_sessions": total_sessions,
+            "active_sessions": total_sessions,
+            "expired_sessions": 0,
+            "total_messages": total_messages,
+            "avg_messages_per_session": (
+                total_messages / total_sessions if total_sessions > 0 else 0
+            )
+        }
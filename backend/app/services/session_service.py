@@ -1,21 +1,33 @@
 """Session management service for agent conversations."""
 
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set
+from datetime import datetime
 
 from app.config import settings
+from app.utils.serialization import to_json  # noqa: F401 - serializes sessions and messages
+from app.services.redis_session_service import REDIS_AVAILABLE, RedisSessionService
 
 logger = logging.getLogger(__name__)
 
+# Number of per-session lock stripes (power of two)
+LOCK_STRIPES = 64
+
+# Accesses closer together than this do not re-stamp a session
+TOUCH_DEBOUNCE_SECONDS = 1.0
+
 
 class InMemorySessionService:
     """
     In-memory session service for managing agent conversation state.
     
     This service maintains conversation history and context across multiple
-    agent interactions. In production, this could be backed by Redis or
-    a similar cache.
+    agent interactions. Multi-process deployments should set
+    settings.redis_url to use RedisSessionService instead.
     
     Features:
     - Session creation and retrieval
@@ -26,8 +38,32 @@ class InMemorySessionService:
     
     def __init__(self):
         """Initialize the session service with empty storage."""
-        self._sessions: Dict[str, Dict[str, Any]] = {}
+        # Ordered least- to most-recently accessed, so expired sessions
+        # always sit at the front
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._session_timeout = settings.session_timeout
+        self._max_messages = settings.max_messages_per_session
+        # Running message count across stored sessions, for get_stats
+        self._total_messages = 0
+        # Session IDs per company, for filtered get_active_sessions
+        self._by_company: Dict[int, Set[str]] = defaultdict(set)
+        # Guards the session dict, its LRU order and the counters; only
+        # held for single structural operations. Per-session work is
+        # serialized by a striped lock, always taken before this one.
+        self._lock = threading.Lock()
+        self._stripe_locks = [threading.RLock() for _ in range(LOCK_STRIPES)]
+    
+    def _lock_for(self, session_id: str) -> threading.RLock:
+        """
+        Get the stripe lock guarding a session.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Lock shared by all sessions hashing to the same stripe
+        """
+        return self._stripe_locks[hash(session_id) & (LOCK_STRIPES - 1)]
         
     def create_session(
         self,
@@ -48,18 +84,27 @@ class InMemorySessionService:
         Returns:
             Created session dictionary
         """
+        now = time.time()
         session = {
             "session_id": session_id,
             "company_id": company_id,
             "agent_type": agent_type,
             "created_at": datetime.utcnow(),
-            "last_accessed": datetime.utcnow(),
-            "messages": [],
+            "last_accessed_epoch": now,
+            "messages": deque(maxlen=self._max_messages),
             "context": initial_context or {},
-            "metadata": {}
+            "metadata": {},
+            "_expiry_epoch": now + self._session_timeout
         }
         
-        self._sessions[session_id] = session
+        with self._lock_for(session_id):
+            with self._lock:
+                previous = self._sessions.get(session_id)
+                if previous is not None:
+                    self._on_removed(previous)
+                self._sessions[session_id] = session
+                self._sessions.move_to_end(session_id)
+                self._by_company[company_id].add(session_id)
         
         logger.info(
             f"Created session {session_id}",
@@ -82,17 +127,39 @@ class InMemorySessionService:
         Returns:
             Session dictionary or None if not found
         """
-        session = self._sessions.get(session_id)
+        return self._get_live(session_id)
+    
+    def _get_live(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an unexpired session and refresh its access time.
+        
+        The refresh (and LRU reordering) is skipped when the session was
+        already touched within TOUCH_DEBOUNCE_SECONDS, so tight loops of
+        add_message/get_context calls do not re-stamp it every time.
         
-        if session:
-            # Update last accessed time
-            session["last_accessed"] = datetime.utcnow()
+        Args:
+            session_id: Session identifier
             
-            # Check if session has expired
-            if self._is_expired(session):
-                logger.info(f"Session {session_id} has expired, removing")
-                self.delete_session(session_id)
-                return None
+        Returns:
+            Session dictionary or None if not found or expired
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        
+        now = time.time()
+        if now > session["_expiry_epoch"]:
+            logger.info(f"Session {session_id} has expired, removing")
+            self.delete_session(session_id)
+            return None
+        
+        if now - session["last_accessed_epoch"] >= TOUCH_DEBOUNCE_SECONDS:
+            # Update last accessed time and move to the back of the LRU order
+            session["last_accessed_epoch"] = now
+            session["_expiry_epoch"] = now + self._session_timeout
+            with self._lock:
+                if session_id in self._sessions:
+                    self._sessions.move_to_end(session_id)
         
         return session
     
@@ -115,20 +182,25 @@ class InMemorySessionService:
         Returns:
             True if message was added, False if session not found
         """
-        session = self.get_session(session_id)
-        
-        if not session:
-            logger.warning(f"Session {session_id} not found for adding message")
-            return False
-        
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": metadata or {}
-        }
-        
-        session["messages"].append(message)
+        with self._lock_for(session_id):
+            session = self._get_live(session_id)
+            
+            if not session:
+                logger.warning(f"Session {session_id} not found for adding message")
+                return False
+            
+            messages = session["messages"]
+            if len(messages) < messages.maxlen:
+                with self._lock:
+                    self._total_messages += 1
+            
+            # A full history drops its oldest message on append
+            messages.append({
+                "role": role,
+                "content": content,
+                "timestamp_ms": time.time_ns() // 1_000_000,
+                "metadata": metadata or {}
+            })
         
         logger.debug(
             f"Added message to session {session_id}",
@@ -156,7 +228,7 @@ class InMemorySessionService:
         Returns:
             List of messages (empty if session not found)
         """
-        session = self.get_session(session_id)
+        session = self._get_live(session_id)
         
         if not session:
             return []
@@ -164,9 +236,12 @@ class InMemorySessionService:
         messages = session["messages"]
         
         if limit:
-            messages = messages[-limit:]
+            # Walk back from the newest message instead of copying the history
+            recent = list(islice(reversed(messages), limit))
+            recent.reverse()
+            return recent
         
-        return messages
+        return list(messages)
     
     def update_context(
         self,
@@ -183,13 +258,14 @@ class InMemorySessionService:
         Returns:
             True if context was updated, False if session not found
         """
-        session = self.get_session(session_id)
-        
-        if not session:
-            logger.warning(f"Session {session_id} not found for context update")
-            return False
-        
-        session["context"].update(context_updates)
+        with self._lock_for(session_id):
+            session = self._get_live(session_id)
+            
+            if not session:
+                logger.warning(f"Session {session_id} not found for context update")
+                return False
+            
+            session["context"].update(context_updates)
         
         logger.debug(
             f"Updated context for session {session_id}",
@@ -211,7 +287,7 @@ class InMemorySessionService:
         Returns:
             Context dictionary (empty if session not found)
         """
-        session = self.get_session(session_id)
+        session = self._get_live(session_id)
         
         if not session:
             return {}
@@ -228,8 +304,13 @@ class InMemorySessionService:
         Returns:
             True if session was deleted, False if not found
         """
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        with self._lock_for(session_id):
+            with self._lock:
+                session = self._sessions.pop(session_id, None)
+                if session is not None:
+                    self._on_removed(session)
+        
+        if session is not None:
             logger.info(f"Deleted session {session_id}")
             return True
         
@@ -242,19 +323,33 @@ class InMemorySessionService:
         Returns:
             Number of sessions removed
         """
-        expired_sessions = [
-            session_id
-            for session_id, session in self._sessions.items()
-            if self._is_expired(session)
-        ]
-        
-        for session_id in expired_sessions:
-            self.delete_session(session_id)
-        
-        if expired_sessions:
-            logger.info(f"Cleaned up {len(expired_sessions)} expired sessions")
-        
-        return len(expired_sessions)
+        now = time.time()
+        
+        # Only the expired prefix of the LRU order is visited
+        expired_ids = []
+        with self._lock:
+            for session_id, session in self._sessions.items():
+                if session["_expiry_epoch"] > now:
+                    break
+                expired_ids.append(session_id)
+        
+        # A session may have been touched since the snapshot; re-check it
+        # under its own lock before removing
+        removed = 0
+        for session_id in expired_ids:
+            with self._lock_for(session_id):
+                with self._lock:
+                    session = self._sessions.get(session_id)
+                    if session is None or session["_expiry_epoch"] > now:
+                        continue
+                    del self._sessions[session_id]
+                    self._on_removed(session)
+                removed += 1
+        
+        if removed:
+            logger.info(f"Cleaned up {removed} expired sessions")
+        
+        return removed
     
     def get_active_sessions(self, company_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -266,26 +361,50 @@ class InMemorySessionService:
         Returns:
             List of active session summaries
         """
+        with self._lock:
+            if company_id is None:
+                snapshot = list(self._sessions.items())
+            else:
+                snapshot = [
+                    (session_id, self._sessions[session_id])
+                    for session_id in self._by_company.get(company_id, ())
+                ]
+        
         sessions = []
         
-        for session_id, session in self._sessions.items():
+        for session_id, session in snapshot:
             if self._is_expired(session):
                 continue
             
-            if company_id is not None and session["company_id"] != company_id:
-                continue
-            
             sessions.append({
                 "session_id": session_id,
                 "company_id": session["company_id"],
                 "agent_type": session["agent_type"],
-                "created_at": session["created_at"].isoformat(),
-                "last_accessed": session["last_accessed"].isoformat(),
+                "created_at": session["created_at"],
+                "last_accessed": datetime.utcfromtimestamp(session["last_accessed_epoch"]),
                 "message_count": len(session["messages"])
             })
         
         return sessions
     
+    def _on_removed(self, session: Dict[str, Any]) -> None:
+        """
+        Update bookkeeping for a session dropped from the store.
+        
+        Removes it from the company index and the running message count.
+        Must be called with self._lock held.
+        
+        Args:
+            session: Session dictionary that is no longer stored
+        """
+        company_sessions = self._by_company.get(session["company_id"])
+        if company_sessions is not None:
+            company_sessions.discard(session["session_id"])
+            if not company_sessions:
+                del self._by_company[session["company_id"]]
+        
+        self._total_messages -= len(session["messages"])
+    
     def _is_expired(self, session: Dict[str, Any]) -> bool:
         """
         Check if a session has expired.
@@ -296,10 +415,7 @@ class InMemorySessionService:
         Returns:
             True if expired, False otherwise
         """
-        last_accessed = session["last_accessed"]
-        expiry_time = last_accessed + timedelta(seconds=self._session_timeout)
-        
-        return datetime.utcnow() > expiry_time
+        return time.time() > session["_expiry_epoch"]
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -308,17 +424,19 @@ class InMemorySessionService:
         Returns:
             Dictionary of session statistics
         """
-        total_sessions = len(self._sessions)
-        expired_count = sum(
-            1 for session in self._sessions.values()
-            if self._is_expired(session)
-        )
-        active_count = total_sessions - expired_count
-        
-        total_messages = sum(
-            len(session["messages"])
-            for session in self._sessions.values()
-        )
+        with self._lock:
+            total_sessions = len(self._sessions)
+            
+            # Expired sessions form a prefix of the LRU order
+            now = time.time()
+            expired_count = 0
+            for session in self._sessions.values():
+                if session["_expiry_epoch"] > now:
+                    break
+                expired_count += 1
+            active_count = total_sessions - expired_count
+            
+            total_messages = self._total_messages
         
         return {
             "total_sessions": total_sessions,
@@ -331,6 +449,15 @@ class InMemorySessionService:
         }
 
 
+def _build_session_service():
+    """Pick the session backend from settings."""
+    if settings.redis_url:
+        if REDIS_AVAILABLE:
+            return RedisSessionService(settings.redis_url)
+        logger.warning("redis_url is set but redis is not installed; using in-memory sessions")
+    return InMemorySessionService()
+
+
 # Global session service instance
-session_service = InMemorySessionService()
+session_service = _build_session_service()
 
@@ -0,0 +1,312 @@
+"""Transaction persistence service for bulk writes."""
+
+import asyncio
+import csv
+import io
+import logging
+from datetime import date
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.schemas import CategorySpending, TransactionCreate
+from app.models.transaction import TRANSACTION_SIGN, Transaction, TransactionType, to_cents
+
+logger = logging.getLogger(__name__)
+
+# Columns written by bulk inserts (signed_amount and timestamps are filled
+# in by the database)
+BULK_COLUMNS = (
+    "company_id",
+    "date",
+    "amount_cents",
+    "category",
+    "type",
+    "description"
+)
+
+_TYPE_COLUMN_TYPE = Transaction.__table__.c.type.type
+
+# Rows parsed and inserted per batch when importing CSV uploads
+CSV_CHUNK_SIZE = 10_000
+
+
+class TransactionService:
+    """
+    Service for writing transactions in bulk (e.g. CSV uploads).
+    
+    On PostgreSQL with asyncpg, rows are streamed with COPY FROM STDIN in a
+    single round-trip. Other backends get one multi-row INSERT statement.
+    The caller owns the transaction and is responsible for committing.
+    """
+    
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        transactions: Sequence[TransactionCreate]
+    ) -> int:
+        """
+        Insert many transactions at once.
+        
+        Args:
+            db: Database session
+            transactions: Validated transactions to insert
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not transactions:
+            return 0
+        
+        conn = await db.connection()
+        
+        if conn.dialect.driver == "asyncpg":
+            records = [
+                (
+                    t.company_id,
+                    t.date,
+                    to_cents(t.amount),
+                    t.category,
+                    _TYPE_COLUMN_TYPE.process_bind_param(t.type, conn.dialect),
+                    t.description
+                )
+                for t in transactions
+            ]
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                Transaction.__tablename__,
+                records=records,
+                columns=list(BULK_COLUMNS)
+            )
+        else:
+            rows: List[Dict[str, Any]] = [
+                {
+                    "company_id": t.company_id,
+                    "date": t.date,
+                    "amount_cents": to_cents(t.amount),
+                    "category": t.category,
+                    "type": t.type,
+                    "description": t.description
+                }
+                for t in transactions
+            ]
+            await db.execute(insert(Transaction), rows)
+        
+        logger.info("Bulk inserted %d transactions", len(transactions))
+        return len(transactions)
+    
+    async def get_totals(
+        self,
+        db: AsyncSession,
+        company_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict[str, float]:
+        """
+        Compute income, expense and net totals for a company.
+        
+        Only (type, amount) pairs are fetched; signs come from a lookup
+        table and the sums run over a float64 array.
+        
+        Args:
+            db: Database session
+            company_id: ID of the company
+            start_date: Optional inclusive start date
+            end_date: Optional inclusive end date
+            
+        Returns:
+            Dictionary with total_income, total_expenses and net_balance
+        """
+        query = select(Transaction.type, Transaction.amount_cents).where(
+            Transaction.company_id == company_id
+        )
+        if start_date:
+            query = query.where(Transaction.date >= start_date)
+        if end_date:
+            query = query.where(Transaction.date <= end_date)
+        
+        rows = (await db.execute(query)).all()
+        signed = np.fromiter(
+            (TRANSACTION_SIGN[t] * cents for t, cents in rows),
+            dtype=np.float64,
+            count=len(rows)
+        )
+        
+        total_income = float(signed[signed > 0].sum()) / 100
+        total_expenses = float(-signed[signed < 0].sum()) / 100
+        
+        return {
+            "total_income": total_income,
+            "total_expenses": total_expenses,
+            "net_balance": total_income - total_expenses
+        }
+    
+    async def get_category_breakdown(
+        self,
+        db: AsyncSession,
+        company_id: int,
+        transaction_type: TransactionType = TransactionType.EXPENSE,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[CategorySpending]:
+        """
+        Aggregate transactions by category in the database.
+        
+        Args:
+            db: Database session
+            company_id: ID of the company
+            transaction_type: Income or expense
+            start_date: Optional inclusive start date
+            end_date: Optional inclusive end date
+            
+        Returns:
+            CategorySpending entries sorted by total amount (descending)
+        """
+        total = func.sum(Transaction.amount_cents)
+        query = select(
+            Transaction.category,
+            total.label("total"),
+            func.count().label("cnt"),
+            func.sum(total).over().label("grand_total")
+        ).where(
+            Transaction.company_id == company_id,
+            Transaction.type == transaction_type
+        )
+        if start_date:
+            query = query.where(Transaction.date >= start_date)
+        if end_date:
+            query = query.where(Transaction.date <= end_date)
+        query = query.group_by(Transaction.category).order_by(total.desc())
+        
+        rows = (await db.execute(query)).all()
+        
+        return [
+            CategorySpending(
+                category=row.category,
+                total_amount=row.total / 100,
+                transaction_count=row.cnt,
+                percentage=float(row.total) * 100 / float(row.grand_total) if row.grand_total else 0.0
+            )
+            for row in rows
+        ]
+    
+    async def import_csv(
+        self,
+        db: AsyncSession,
+        company_id: int,
+        stream: BinaryIO,
+        chunk_size: int = CSV_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Stream a CSV upload into the database in fixed-size chunks.
+        
+        Memory is bounded by the chunk size rather than the file size. The
+        next chunk is parsed in a worker thread while the current one is
+        being written.
+        
+        Expected CSV format:
+        date,amount,category,type,description
+        2024-01-15,1500.00,Salaries,expense,Employee payroll
+        
+        Args:
+            db: Database session
+            company_id: ID of the company
+            stream: Binary file object (e.g. UploadFile.file)
+            chunk_size: Rows per batch
+            
+        Returns:
+            Dictionary with inserted and invalid row counts
+        """
+        # utf-8-sig drops the byte order mark spreadsheet exports often start
+        # with, which would otherwise end up in the first header name
+        reader = csv.reader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+        header = next(reader, [])
+        # Resolve column positions once; as with DictReader, the last of
+        # duplicate headers wins
+        columns = {name: i for i, name in enumerate(header)}
+        rows = enumerate(filter(None, reader), start=2)  # Start at 2 (after header), skipping blank lines
+        errors: List[Dict[str, Any]] = []
+        inserted = 0
+        
+        def read_chunk() -> List[TransactionCreate]:
+            chunk, chunk_errors = self._parse_chunk(rows, columns, len(header), company_id, chunk_size)
+            errors.extend(chunk_errors)
+            return chunk
+        
+        chunk = await asyncio.to_thread(read_chunk)
+        while chunk:
+            next_chunk, count = await asyncio.gather(
+                asyncio.to_thread(read_chunk),
+                self.bulk_create(db, chunk)
+            )
+            inserted += count
+            chunk = next_chunk
+        
+        return {
+            "success": inserted > 0,
+            "inserted_rows": inserted,
+            "invalid_rows": len(errors),
+            "errors": errors
+        }
+    
+    @staticmethod
+    def _parse_chunk(
+        rows: Iterator[Tuple[int, List[str]]],
+        columns: Dict[str, int],
+        width: int,
+        company_id: int,
+        chunk_size: int
+    ) -> Tuple[List[TransactionCreate], List[Dict[str, Any]]]:
+        """
+        Validate CSV rows until chunk_size valid transactions are collected.
+        
+        Args:
+            rows: Iterator of (row number, CSV row fields) pairs
+            columns: Position of each header column
+            width: Number of header columns
+            company_id: ID of the company
+            chunk_size: Maximum number of valid transactions to return
+            
+        Returns:
+            Tuple of (valid transactions, row errors)
+        """
+        validate = TransactionCreate.__pydantic_validator__.validate_python
+        transactions: List[TransactionCreate] = []
+        errors: List[Dict[str, Any]] = []
+        
+        # Absent columns point at a None slot appended after the header width
+        date_i, amount_i, category_i, type_i, description_i = (
+            columns.get(name, width)
+            for name in ("date", "amount", "category", "type", "description")
+        )
+        
+        for row_num, row in rows:
+            if len(row) == width:
+                row.append(None)
+            else:
+                # Missing fields read as None and extra fields are ignored
+                row = row[:width] + [None] * (width + 1 - min(len(row), width))
+            try:
+                transactions.append(validate({
+                    "company_id": company_id,
+                    "date": row[date_i],
+                    "amount": row[amount_i],
+                    "category": (row[category_i] or "").strip(),
+                    "type": (row[type_i] or "").strip().lower(),
+                    "description": (row[description_i] or "").strip() or None
+                }))
+            except ValidationError as e:
+                errors.append({"row": row_num, "error": str(e)})
+            
+            if len(transactions) >= chunk_size:
+                break
+        
+        return transactions, errors
+
+
+# Global transaction service instance
+transaction_service = TransactionService()
@@ -1,18 +1,29 @@
 """Custom tools for agent operations"""
 
-from app.tools.financial_calculator import financial_calculator, FinancialCalculator
-from app.tools.data_processor import data_processor, DataProcessor
-from app.tools.chart_generator import chart_generator, ChartGenerator
-from app.tools.web_search import web_search, WebSearch
+from importlib import import_module
 
-__all__ = [
-    "financial_calculator",
-    "FinancialCalculator",
-    "data_processor",
-    "DataProcessor",
-    "chart_generator",
-    "ChartGenerator",
-    "web_search",
-    "WebSearch"
-]
+# Tools are resolved on first attribute access so that importing one tool
+# (e.g. app.tools.financial_calculator) does not pull in the others.
+_EXPORTS = {
+    "financial_calculator": "app.tools.financial_calculator",
+    "FinancialCalculator": "app.tools.financial_calculator",
+    "TransactionTable": "app.tools.financial_calculator",
+    "data_processor": "app.tools.data_processor",
+    "DataProcessor": "app.tools.data_processor",
+    "TransactionRecord": "app.tools.data_processor",
+    "chart_generator": "app.tools.chart_generator",
+    "ChartGenerator": "app.tools.chart_generator",
+    "web_search": "app.tools.web_search",
+    "WebSearch": "app.tools.web_search"
+}
 
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Lazily import and cache tool exports."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -1,13 +1,51 @@
 """Chart data generation tools for frontend visualization."""
 
+import functools
+import hashlib
+import heapq
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+import threading
+import time
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import date, datetime, timedelta
 from dateutil.relativedelta import relativedelta
+import numpy as np
+import orjson
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Parsed transaction records shared by the chart builders; mk is the
+# integer month index (year * 12 + month - 1)
+RECORD_DTYPE = np.dtype([
+    ("mk", "i4"),
+    ("amt", "f8"),
+    ("type", "O"),
+    ("cat", "O")
+])
+
+Transactions = Union[List[Dict[str, Any]], np.ndarray]
+
+_MONTH_ABBR = (
+    "", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+)
+
+# Seconds a combined dashboard is reused for identical inputs
+DASHBOARD_CACHE_TTL = 60.0
+
+# (transactions digest, initial_capital, months) -> (computed_at, dashboard)
+_dashboard_cache: Dict[Tuple[bytes, float, int], Tuple[float, Dict[str, Any]]] = {}
+_dashboard_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=512)
+def _month_label(month_key: int) -> Tuple[str, str]:
+    """Format a month index as ("YYYY-MM", "Mon YYYY"); labels recur across charts."""
+    year, month = divmod(month_key, 12)
+    return f"{year:04d}-{month + 1:02d}", f"{_MONTH_ABBR[month + 1]} {year}"
+
 
 class ChartGenerator:
     """
@@ -20,65 +58,157 @@ class ChartGenerator:
     - Trend analysis
     """
     
+    @staticmethod
+    def _preprocess(
+        transactions: Transactions,
+        cutoff_mk: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Parse transactions once into a RECORD_DTYPE array.
+        
+        Already-parsed record arrays are returned unchanged, so the
+        dashboard can parse once and hand the result to every chart.
+        
+        Args:
+            transactions: List of transaction dictionaries or parsed records
+            cutoff_mk: Optional first month index to keep; rows clearly
+                older than it are skipped before parsing
+            
+        Returns:
+            Structured array of transaction records
+        """
+        if isinstance(transactions, np.ndarray):
+            return transactions
+        
+        if cutoff_mk is not None:
+            # ISO-8601 strings sort chronologically; the one-day margin keeps
+            # timezone offsets safe and _window applies the exact cutoff
+            year, month = divmod(cutoff_mk, 12)
+            cutoff_iso = (date(year, month + 1, 1) - timedelta(days=1)).isoformat()
+            transactions = [t for t in transactions if t["date"] >= cutoff_iso]
+        
+        df = pd.DataFrame(transactions, columns=["date", "amount", "type", "category"])
+        dates = pd.to_datetime(df["date"], utc=True, format="ISO8601").dt.tz_localize(None)
+        
+        records = np.empty(len(df), dtype=RECORD_DTYPE)
+        records["mk"] = dates.dt.year * 12 + dates.dt.month - 1
+        records["amt"] = df["amount"].to_numpy(dtype=np.float64)
+        records["type"] = df["type"].to_numpy()
+        records["cat"] = df["category"].fillna("Uncategorized").to_numpy()
+        return records
+    
+    @staticmethod
+    def _cutoff(months: int) -> int:
+        """Month index of the first calendar month in the lookback window (UTC)."""
+        cutoff = datetime.utcnow() - relativedelta(months=months)
+        return cutoff.year * 12 + cutoff.month - 1
+    
+    @staticmethod
+    def _window(records: np.ndarray, cutoff_mk: int) -> np.ndarray:
+        """Keep records from the cutoff month onwards."""
+        return records[records["mk"] >= cutoff_mk]
+    
+    @staticmethod
+    def _monthly_sums(
+        month_keys: np.ndarray,
+        weights: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sum weights per month index.
+        
+        Args:
+            month_keys: Integer month index per record
+            weights: Values to sum per record
+            
+        Returns:
+            Tuple of (month indices that have records, sums for those months)
+        """
+        if len(month_keys) == 0:
+            return month_keys, weights
+        offset = month_keys.min()
+        idx = month_keys - offset
+        present = np.bincount(idx) > 0
+        sums = np.bincount(idx, weights=weights)
+        return np.flatnonzero(present) + offset, sums[present]
+    
+    @staticmethod
+    def _month_strings(month_keys: np.ndarray) -> Tuple[List[str], List[str]]:
+        """Format month indices as ("YYYY-MM", "Mon YYYY") string lists."""
+        pairs = [_month_label(key) for key in month_keys.tolist()]
+        return [month for month, _ in pairs], [label for _, label in pairs]
+    
+    @staticmethod
+    def _chart_data(
+        series: Dict[str, List[Any]],
+        columnar: bool
+    ) -> Union[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """
+        Shape column-wise chart series for output.
+        
+        Args:
+            series: Equal-length lists keyed by field name
+            columnar: Return the series as-is instead of one dict per point
+            
+        Returns:
+            The series dictionary, or a list of per-point dictionaries
+        """
+        if columnar:
+            return series
+        return [dict(zip(series, point)) for point in zip(*series.values())]
+    
     @staticmethod
     def generate_burn_rate_chart(
-        transactions: List[Dict[str, Any]],
-        months: int = 12
+        transactions: Transactions,
+        months: int = 12,
+        columnar: bool = False
     ) -> Dict[str, Any]:
         """
         Generate monthly burn rate chart data.
         
         Args:
-            transactions: List of transaction dictionaries
+            transactions: List of transaction dictionaries (or parsed records)
             months: Number of months to include
+            columnar: Return data as one list per field instead of one
+                dictionary per month
             
         Returns:
             Chart data dictionary
         """
         try:
-            # Filter to date range
-            cutoff_date = datetime.utcnow() - timedelta(days=months * 30)
-            recent_transactions = [
-                t for t in transactions
-                if datetime.fromisoformat(t["date"].replace("Z", "+00:00")) >= cutoff_date
-            ]
-            
-            # Group by month
-            monthly_data = defaultdict(lambda: {"income": 0.0, "expenses": 0.0})
-            
-            for transaction in recent_transactions:
-                date = datetime.fromisoformat(transaction["date"].replace("Z", "+00:00"))
-                month_key = date.strftime("%Y-%m")
-                amount = float(transaction["amount"])
-                
-                if transaction["type"] == "income":
-                    monthly_data[month_key]["income"] += amount
-                else:
-                    monthly_data[month_key]["expenses"] += amount
+            cutoff_mk = ChartGenerator._cutoff(months)
+            records = ChartGenerator._window(
+                ChartGenerator._preprocess(transactions, cutoff_mk),
+                cutoff_mk
+            )
             
-            # Sort by month and calculate burn rate
-            sorted_months = sorted(monthly_data.items())
+            # Split amounts into income/expense and sum per month
+            is_income = records["type"] == "income"
+            month_keys, income = ChartGenerator._monthly_sums(
+                records["mk"], np.where(is_income, records["amt"], 0.0)
+            )
+            _, expenses = ChartGenerator._monthly_sums(
+                records["mk"], np.where(is_income, 0.0, records["amt"])
+            )
             
-            chart_data = []
-            for month, data in sorted_months:
-                burn_rate = data["expenses"] - data["income"]
-                chart_data.append({
-                    "month": month,
-                    "month_label": datetime.strptime(month, "%Y-%m").strftime("%b %Y"),
-                    "income": round(data["income"], 2),
-                    "expenses": round(data["expenses"], 2),
-                    "burn_rate": round(burn_rate, 2),
-                    "net_cash_flow": round(-burn_rate, 2)
-                })
+            burn_rate = expenses - income
+            month_names, month_labels = ChartGenerator._month_strings(month_keys)
+            chart_data = ChartGenerator._chart_data({
+                "month": month_names,
+                "month_label": month_labels,
+                "income": np.round(income, 2).tolist(),
+                "expenses": np.round(expenses, 2).tolist(),
+                "burn_rate": np.round(burn_rate, 2).tolist(),
+                "net_cash_flow": np.round(-burn_rate, 2).tolist()
+            }, columnar)
             
             result = {
                 "type": "burn_rate_chart",
                 "data": chart_data,
-                "months": len(chart_data),
+                "months": len(month_names),
                 "period": f"{months} months"
             }
             
-            logger.debug(f"Generated burn rate chart with {len(chart_data)} data points")
+            logger.debug(f"Generated burn rate chart with {len(month_names)} data points")
             
             return result
             
@@ -92,7 +222,7 @@ class ChartGenerator:
     
     @staticmethod
     def generate_category_breakdown_chart(
-        transactions: List[Dict[str, Any]],
+        transactions: Transactions,
         transaction_type: str = "expense",
         top_n: int = 10
     ) -> Dict[str, Any]:
@@ -100,7 +230,7 @@ class ChartGenerator:
         Generate category breakdown chart data (for pie/bar charts).
         
         Args:
-            transactions: List of transaction dictionaries
+            transactions: List of transaction dictionaries (or parsed records)
             transaction_type: "income" or "expense"
             top_n: Number of top categories to show
             
@@ -108,44 +238,39 @@ class ChartGenerator:
             Chart data dictionary
         """
         try:
-            # Filter by type
-            filtered_transactions = [
-                t for t in transactions
-                if t["type"] == transaction_type
-            ]
+            records = ChartGenerator._preprocess(transactions)
             
-            # Group by category
-            category_totals = defaultdict(float)
-            for transaction in filtered_transactions:
-                category = transaction.get("category", "Uncategorized")
-                category_totals[category] += float(transaction["amount"])
-            
-            # Sort and take top N
-            sorted_categories = sorted(
-                category_totals.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
+            # Sum per category for the requested type
+            records = records[records["type"] == transaction_type]
+            categories, inverse = np.unique(records["cat"], return_inverse=True)
+            totals = np.bincount(inverse, weights=records["amt"], minlength=len(categories))
             
-            top_categories = sorted_categories[:top_n]
+            # Only the top N need ordering; ties keep alphabetical order
+            top_categories = heapq.nlargest(
+                top_n, zip(categories.tolist(), totals.tolist()), key=itemgetter(1)
+            )
+            top_totals = np.array([amount for _, amount in top_categories], dtype=np.float64)
             
             # Calculate total and percentages
-            total = sum(amount for _, amount in top_categories)
+            total = sum(top_totals.tolist())
+            percentages = top_totals / total * 100 if total > 0 else np.zeros_like(top_totals)
             
-            chart_data = []
-            for category, amount in top_categories:
-                percentage = (amount / total * 100) if total > 0 else 0
-                chart_data.append({
+            chart_data = [
+                {
                     "category": category,
-                    "amount": round(amount, 2),
-                    "percentage": round(percentage, 2)
-                })
+                    "amount": amount,
+                    "percentage": percentage
+                }
+                for category, amount, percentage in zip(
+                    [category for category, _ in top_categories],
+                    np.round(top_totals, 2).tolist(),
+                    np.round(percentages, 2).tolist()
+                )
+            ]
             
             # Add "Other" category if needed
-            if len(sorted_categories) > top_n:
-                other_amount = sum(
-                    amount for _, amount in sorted_categories[top_n:]
-                )
+            if len(categories) > top_n:
+                other_amount = sum(totals.tolist()) - total
                 other_percentage = (other_amount / (total + other_amount) * 100)
                 chart_data.append({
                     "category": "Other",
@@ -158,7 +283,7 @@ class ChartGenerator:
                 "transaction_type": transaction_type,
                 "data": chart_data,
                 "total": round(total, 2),
-                "category_count": len(category_totals)
+                "category_count": len(categories)
             }
             
             logger.debug(
@@ -194,30 +319,35 @@ class ChartGenerator:
             Chart data dictionary
         """
         try:
-            chart_data = []
-            balance = current_balance
             current_date = datetime.utcnow()
+            current_mk = current_date.year * 12 + current_date.month - 1
             
-            for month in range(forecast_months + 1):
-                forecast_date = current_date + relativedelta(months=month)
-                
-                chart_data.append({
-                    "month": forecast_date.strftime("%Y-%m"),
-                    "month_label": forecast_date.strftime("%b %Y"),
-                    "balance": round(max(0, balance), 2),
-                    "is_projected": month > 0,
-                    "is_depleted": balance <= 0
-                })
-                
-                # Calculate next month's balance
-                balance -= monthly_burn_rate
+            # Balance after each month of burn; month 0 is the current balance
+            raw = current_balance - np.arange(forecast_months + 1, dtype=np.float64) * monthly_burn_rate
+            depleted = raw <= 0
+            balances = np.round(np.maximum(raw, 0.0), 2)
+            
+            month_names, month_labels = ChartGenerator._month_strings(
+                np.arange(current_mk, current_mk + forecast_months + 1)
+            )
+            chart_data = [
+                {
+                    "month": month,
+                    "month_label": label,
+                    "balance": balance,
+                    "is_projected": i > 0,
+                    "is_depleted": is_depleted
+                }
+                for i, (month, label, balance, is_depleted) in enumerate(zip(
+                    month_names,
+                    month_labels,
+                    balances.tolist(),
+                    depleted.tolist()
+                ))
+            ]
             
             # Find depletion point
-            depletion_month = None
-            for i, point in enumerate(chart_data):
-                if point["is_depleted"] and depletion_month is None:
-                    depletion_month = i
-                    break
+            depletion_month = int(depleted.argmax()) if depleted.any() else None
             
             result = {
                 "type": "runway_forecast_chart",
@@ -243,71 +373,107 @@ class ChartGenerator:
                 "error": str(e)
             }
     
+    @staticmethod
+    def generate_forecast_series(
+        current_balance: float,
+        monthly_income: float,
+        monthly_expenses: float,
+        forecast_months: int = 12
+    ) -> Dict[str, Any]:
+        """
+        Generate a column-wise monthly forecast (one list per series).
+        
+        Args:
+            current_balance: Current cash balance
+            monthly_income: Projected monthly income
+            monthly_expenses: Projected monthly expenses
+            forecast_months: Number of months to forecast
+            
+        Returns:
+            Dictionary matching the ForecastSeries schema
+        """
+        try:
+            current_date = datetime.utcnow()
+            current_mk = current_date.year * 12 + current_date.month - 1
+            months, _ = ChartGenerator._month_strings(
+                np.arange(current_mk, current_mk + forecast_months + 1)
+            )
+            
+            # Month 0 is the current balance; projections start at month 1
+            income = np.full(forecast_months + 1, float(monthly_income))
+            expenses = np.full(forecast_months + 1, float(monthly_expenses))
+            income[0] = expenses[0] = 0.0
+            balance = current_balance + np.cumsum(income - expenses)
+            
+            return {
+                "months": months,
+                "balance": np.round(balance, 2).tolist(),
+                "income": np.round(income, 2).tolist(),
+                "expenses": np.round(expenses, 2).tolist()
+            }
+            
+        except Exception as e:
+            logger.error(f"Error generating forecast series: {e}", exc_info=True)
+            return {
+                "months": [],
+                "balance": [],
+                "income": [],
+                "expenses": [],
+                "error": str(e)
+            }
+    
     @staticmethod
     def generate_balance_history_chart(
         initial_capital: float,
-        transactions: List[Dict[str, Any]],
-        months: int = 12
+        transactions: Transactions,
+        months: int = 12,
+        columnar: bool = False
     ) -> Dict[str, Any]:
         """
         Generate balance over time chart.
         
         Args:
             initial_capital: Starting capital
-            transactions: List of transaction dictionaries
+            transactions: List of transaction dictionaries (or parsed records)
             months: Number of months to include
+            columnar: Return data as one list per field instead of one
+                dictionary per month
             
         Returns:
             Chart data dictionary
         """
         try:
-            # Filter and sort transactions
-            cutoff_date = datetime.utcnow() - timedelta(days=months * 30)
-            transactions = [
-                t for t in transactions
-                if datetime.fromisoformat(t["date"].replace("Z", "+00:00")) >= cutoff_date
-            ]
-            transactions.sort(key=lambda t: t["date"])
-            
-            # Calculate cumulative balance by month
-            monthly_balance = defaultdict(float)
-            balance = initial_capital
-            
-            for transaction in transactions:
-                date = datetime.fromisoformat(transaction["date"].replace("Z", "+00:00"))
-                month_key = date.strftime("%Y-%m")
-                amount = float(transaction["amount"])
-                
-                if transaction["type"] == "income":
-                    balance += amount
-                else:
-                    balance -= amount
-                
-                # Store the end-of-month balance (will be overwritten)
-                monthly_balance[month_key] = balance
+            cutoff_mk = ChartGenerator._cutoff(months)
+            records = ChartGenerator._window(
+                ChartGenerator._preprocess(transactions, cutoff_mk),
+                cutoff_mk
+            )
             
-            # Generate chart data
-            sorted_months = sorted(monthly_balance.items())
-            
-            chart_data = []
-            for month, balance in sorted_months:
-                chart_data.append({
-                    "month": month,
-                    "month_label": datetime.strptime(month, "%Y-%m").strftime("%b %Y"),
-                    "balance": round(balance, 2),
-                    "is_positive": balance > 0
-                })
+            # End-of-month balance is the running total of monthly net flow
+            signed = np.where(records["type"] == "income", records["amt"], -records["amt"])
+            month_keys, net = ChartGenerator._monthly_sums(records["mk"], signed)
+            monthly_balance = initial_capital + np.cumsum(net)
+            balance = float(monthly_balance[-1]) if len(monthly_balance) else initial_capital
+            
+            month_names, month_labels = ChartGenerator._month_strings(month_keys)
+            rounded_balance = np.round(monthly_balance, 2)
+            chart_data = ChartGenerator._chart_data({
+                "month": month_names,
+                "month_label": month_labels,
+                "balance": rounded_balance.tolist(),
+                "is_positive": (rounded_balance > 0).tolist()
+            }, columnar)
             
             result = {
                 "type": "balance_history_chart",
                 "data": chart_data,
                 "initial_capital": round(initial_capital, 2),
                 "final_balance": round(balance, 2),
-                "months": len(chart_data)
+                "months": len(month_names)
             }
             
             logger.debug(
-                f"Generated balance history chart: {len(chart_data)} data points",
+                f"Generated balance history chart: {len(month_names)} data points",
                 extra={"final_balance": balance}
             )
             
@@ -323,61 +489,56 @@ class ChartGenerator:
     
     @staticmethod
     def generate_trend_chart(
-        transactions: List[Dict[str, Any]],
+        transactions: Transactions,
         metric: str = "income",
-        months: int = 12
+        months: int = 12,
+        columnar: bool = False
     ) -> Dict[str, Any]:
         """
         Generate trend chart for income or expenses.
         
         Args:
-            transactions: List of transaction dictionaries
+            transactions: List of transaction dictionaries (or parsed records)
             metric: "income" or "expenses"
             months: Number of months to include
+            columnar: Return data as one list per field instead of one
+                dictionary per month
             
         Returns:
             Chart data dictionary
         """
         try:
-            # Filter transactions
-            cutoff_date = datetime.utcnow() - timedelta(days=months * 30)
-            transactions = [
-                t for t in transactions
-                if datetime.fromisoformat(t["date"].replace("Z", "+00:00")) >= cutoff_date
-                and t["type"] == metric
+            cutoff_mk = ChartGenerator._cutoff(months)
+            records = ChartGenerator._window(
+                ChartGenerator._preprocess(transactions, cutoff_mk),
+                cutoff_mk
+            )
+            records = records[records["type"] == metric]
+            
+            # Monthly totals and month-over-month growth
+            month_keys, monthly_totals = ChartGenerator._monthly_sums(records["mk"], records["amt"])
+            month_names, month_labels = ChartGenerator._month_strings(month_keys)
+            
+            previous = monthly_totals[:-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                growth = np.round((monthly_totals[1:] - previous) / previous * 100, 2)
+            growth_rates = [None] + [
+                rate if prev > 0 else None
+                for rate, prev in zip(growth.tolist(), previous.tolist())
             ]
             
-            # Group by month
-            monthly_totals = defaultdict(float)
-            for transaction in transactions:
-                date = datetime.fromisoformat(transaction["date"].replace("Z", "+00:00"))
-                month_key = date.strftime("%Y-%m")
-                monthly_totals[month_key] += float(transaction["amount"])
-            
-            # Sort and create chart data
-            sorted_months = sorted(monthly_totals.items())
-            
-            chart_data = []
-            previous_value = None
-            
-            for month, value in sorted_months:
-                growth_rate = None
-                if previous_value and previous_value > 0:
-                    growth_rate = ((value - previous_value) / previous_value) * 100
-                
-                chart_data.append({
-                    "month": month,
-                    "month_label": datetime.strptime(month, "%Y-%m").strftime("%b %Y"),
-                    "value": round(value, 2),
-                    "growth_rate": round(growth_rate, 2) if growth_rate is not None else None
-                })
-                
-                previous_value = value
+            values = np.round(monthly_totals, 2).tolist()
+            chart_data = ChartGenerator._chart_data({
+                "month": month_names,
+                "month_label": month_labels,
+                "value": values,
+                "growth_rate": growth_rates[:len(values)]
+            }, columnar)
             
             # Calculate overall trend
-            if len(chart_data) >= 2:
-                first_value = chart_data[0]["value"]
-                last_value = chart_data[-1]["value"]
+            if len(values) >= 2:
+                first_value = values[0]
+                last_value = values[-1]
                 overall_growth = (
                     ((last_value - first_value) / first_value * 100)
                     if first_value > 0 else 0
@@ -390,11 +551,11 @@ class ChartGenerator:
                 "metric": metric,
                 "data": chart_data,
                 "overall_growth_rate": round(overall_growth, 2),
-                "months": len(chart_data)
+                "months": len(values)
             }
             
             logger.debug(
-                f"Generated trend chart for {metric}: {len(chart_data)} data points",
+                f"Generated trend chart for {metric}: {len(values)} data points",
                 extra={"overall_growth": overall_growth}
             )
             
@@ -411,44 +572,76 @@ class ChartGenerator:
     @staticmethod
     def generate_combined_dashboard_data(
         initial_capital: float,
-        transactions: List[Dict[str, Any]],
+        transactions: Transactions,
         months: int = 12
     ) -> Dict[str, Any]:
         """
         Generate all chart data for a complete dashboard.
         
+        Results for list input are cached for DASHBOARD_CACHE_TTL seconds,
+        keyed on a content hash of the transactions, so repeated refreshes
+        with unchanged data return the same (read-only) dictionary.
+        
         Args:
             initial_capital: Starting capital
-            transactions: List of transaction dictionaries
+            transactions: List of transaction dictionaries (or parsed records)
             months: Number of months to include
             
         Returns:
             Dictionary with all chart data
         """
         try:
+            cache_key = None
+            if not isinstance(transactions, np.ndarray):
+                digest = hashlib.blake2b(
+                    orjson.dumps(transactions, default=str, option=orjson.OPT_SORT_KEYS),
+                    digest_size=16
+                ).digest()
+                cache_key = (digest, initial_capital, months)
+                
+                with _dashboard_lock:
+                    cached = _dashboard_cache.get(cache_key)
+                if cached is not None and time.monotonic() - cached[0] < DASHBOARD_CACHE_TTL:
+                    return cached[1]
+            
+            # Parse once and share the records across every chart; the
+            # date-windowed charts get records already cut to the window
+            records = ChartGenerator._preprocess(transactions)
+            recent = ChartGenerator._window(records, ChartGenerator._cutoff(months))
+            
             result = {
                 "burn_rate_chart": ChartGenerator.generate_burn_rate_chart(
-                    transactions, months
+                    recent, months
                 ),
                 "expense_breakdown": ChartGenerator.generate_category_breakdown_chart(
-                    transactions, "expense", 10
+                    records, "expense", 10
                 ),
                 "income_breakdown": ChartGenerator.generate_category_breakdown_chart(
-                    transactions, "income", 10
+                    records, "income", 10
                 ),
                 "balance_history": ChartGenerator.generate_balance_history_chart(
-                    initial_capital, transactions, months
+                    initial_capital, recent, months
                 ),
                 "income_trend": ChartGenerator.generate_trend_chart(
-                    transactions, "income", months
+                    recent, "income", months
                 ),
                 "expense_trend": ChartGenerator.generate_trend_chart(
-                    transactions, "expense", months
+                    recent, "expense", months
                 )
             }
             
             logger.info(f"Generated combined dashboard data for {months} months")
             
+            if cache_key is not None:
+                now = time.monotonic()
+                with _dashboard_lock:
+                    for key in [
+                        k for k, (computed_at, _) in _dashboard_cache.items()
+                        if now - computed_at >= DASHBOARD_CACHE_TTL
+                    ]:
+                        del _dashboard_cache[key]
+                    _dashboard_cache[cache_key] = (now, result)
+            
             return result
             
         except Exception as e:
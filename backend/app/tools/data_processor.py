@@ -1,14 +1,146 @@
 """Data processing tools for CSV parsing and validation."""
 
+import functools
 import logging
-import csv
 import io
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+import numpy as np
+import pandas as pd
+
+from app.utils.serialization import to_json  # noqa: F401 - serializes parse results
 
 logger = logging.getLogger(__name__)
 
+# Accepted date formats, in priority order (ambiguous dates such as
+# 01/02/2024 resolve to the first matching format)
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d-%m-%Y",
+    "%Y/%m/%d",
+    "%d/%m/%Y"
+)
+
+# Field patterns accepted by strptime for %Y, %m and %d
+_YEAR = r"(\d\d\d\d)"
+_MONTH = r"(1[0-2]|0[1-9]|[1-9])"
+_DAY = r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+
+# Compiled equivalent of each format: (format, pattern, (year, month, day) group numbers)
+_DATE_PATTERNS = tuple(
+    (fmt, re.compile(pattern), groups)
+    for fmt, pattern, groups in (
+        (DATE_FORMATS[0], f"{_YEAR}-{_MONTH}-{_DAY}", (1, 2, 3)),
+        (DATE_FORMATS[1], f"{_MONTH}/{_DAY}/{_YEAR}", (3, 1, 2)),
+        (DATE_FORMATS[2], f"{_DAY}-{_MONTH}-{_YEAR}", (3, 2, 1)),
+        (DATE_FORMATS[3], f"{_YEAR}/{_MONTH}/{_DAY}", (1, 2, 3)),
+        (DATE_FORMATS[4], f"{_DAY}/{_MONTH}/{_YEAR}", (3, 2, 1))
+    )
+)
+
+# Rows per chunk yielded by DataProcessor.parse_csv_iter
+CSV_CHUNK_ROWS = 1000
+
+# CSVs with at least this many rows are validated in parallel worker
+# processes (on multi-core hosts)
+PARALLEL_CSV_ROWS = 50_000
+
+# Largest accepted transaction amount
+MAX_AMOUNT = 999999999.99
+
+# Currency symbol and separators stripped from amounts before parsing
+_AMOUNT_CLEAN_RE = re.compile(r"[$, ]")
+
+# Plain amounts that float() parses exactly within range (at most
+# 999999999.99), so the Decimal checks can be skipped
+_AMOUNT_SHAPE_RE = re.compile(r"\d{1,9}(?:\.\d{1,2})?")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[Tuple[datetime, str]]:
+    """
+    Parse a stripped date string, memoized since CSV dates repeat a lot.
+    
+    Args:
+        date_str: Stripped date string
+        
+    Returns:
+        Tuple of (parsed datetime, matching format), or None if no format matches
+    """
+    # Plain YYYY-MM-DD is both the most common and the first format; build
+    # it directly instead of going through strptime
+    if (
+        len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-"
+        and date_str[:4].isdecimal() and date_str[5:7].isdecimal() and date_str[8:].isdecimal()
+    ):
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:])), DATE_FORMATS[0]
+        except ValueError:
+            pass
+    
+    # Same matching as strptime, without re-interpreting the format string
+    # or raising for every format that does not apply
+    for fmt, pattern, (year, month, day) in _DATE_PATTERNS:
+        match = pattern.fullmatch(date_str)
+        if match is None:
+            continue
+        try:
+            return datetime(int(match[year]), int(match[month]), int(match[day])), fmt
+        except ValueError:
+            continue
+    
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_date_cached(date_str: str) -> Optional[str]:
+    """
+    Get the ISO datetime string for a stripped date string, memoized so
+    repeated dates are neither parsed nor formatted again.
+    
+    Args:
+        date_str: Stripped date string
+        
+    Returns:
+        ISO datetime string, or None if no format matches
+    """
+    parsed = _parse_date_cached(date_str)
+    return parsed[0].isoformat() if parsed is not None else None
+
+
+@dataclass(slots=True)
+class TransactionRecord:
+    """
+    Parsed CSV transaction with fixed fields.
+    
+    Much smaller than the equivalent dictionary, for callers that hold
+    large imports in memory (see parse_csv's as_records flag).
+    """
+    company_id: int
+    date: str
+    amount: float
+    category: str
+    type: str
+    description: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form returned by parse_csv by default."""
+        return {
+            "company_id": self.company_id,
+            "date": self.date,
+            "amount": self.amount,
+            "category": self.category,
+            "type": self.type,
+            "description": self.description
+        }
+
 
 class DataProcessor:
     """
@@ -23,14 +155,23 @@ class DataProcessor:
     """
     
     # Expected CSV columns
-    REQUIRED_COLUMNS = ["date", "amount", "category", "type"]
-    OPTIONAL_COLUMNS = ["description"]
-    VALID_TYPES = ["income", "expense"]
+    REQUIRED_COLUMNS = ("date", "amount", "category", "type")
+    OPTIONAL_COLUMNS = ("description",)
+    VALID_TYPES = frozenset({"income", "expense"})
+    
+    # Set forms of the column lists, built once for membership checks
+    _REQUIRED_SET = frozenset(REQUIRED_COLUMNS)
+    _KNOWN_SET = frozenset(REQUIRED_COLUMNS + OPTIONAL_COLUMNS)
+    
+    # Fields every transaction passed to validate_batch must have
+    BATCH_FIELDS = ("company_id", "date", "amount", "category", "type")
+    _BATCH_FIELD_SET = frozenset(BATCH_FIELDS)
     
     @staticmethod
     def parse_csv(
-        csv_content: str,
-        company_id: int
+        csv_content: Union[str, IO[str]],
+        company_id: int,
+        as_records: bool = False
     ) -> Dict[str, Any]:
         """
         Parse CSV content and validate transaction data.
@@ -40,8 +181,10 @@ class DataProcessor:
         2024-01-15,1500.00,Salaries,expense,Employee payroll
         
         Args:
-            csv_content: CSV file content as string
+            csv_content: CSV file content as string or text file object
             company_id: ID of the company
+            as_records: Return transactions as TransactionRecord objects
+                instead of dictionaries
             
         Returns:
             Dictionary with parsed transactions and validation results
@@ -49,63 +192,32 @@ class DataProcessor:
         try:
             logger.info(f"Parsing CSV for company {company_id}")
             
-            # Parse CSV
-            csv_file = io.StringIO(csv_content)
-            reader = csv.DictReader(csv_file)
+            try:
+                df = DataProcessor._read_csv(csv_content)
+            except pd.errors.EmptyDataError:
+                df = None
             
             # Validate headers
-            if not reader.fieldnames:
-                return {
-                    "success": False,
-                    "error": "CSV file is empty or has no headers",
-                    "transactions": []
-                }
-            
-            missing_cols = set(DataProcessor.REQUIRED_COLUMNS) - set(reader.fieldnames)
-            if missing_cols:
+            error = DataProcessor._check_columns(df)
+            if error:
                 return {
                     "success": False,
-                    "error": f"Missing required columns: {', '.join(missing_cols)}",
+                    "error": error,
                     "transactions": []
                 }
             
-            # Process rows
-            transactions = []
-            errors = []
-            
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
-                result = DataProcessor._validate_transaction_row(
-                    row,
-                    company_id,
-                    row_num
-                )
-                
-                if result["valid"]:
-                    transactions.append(result["transaction"])
-                else:
-                    errors.append({
-                        "row": row_num,
-                        "error": result["error"],
-                        "data": row
-                    })
-            
-            success = len(transactions) > 0
-            
-            result = {
-                "success": success,
-                "transactions": transactions,
-                "total_rows": len(transactions) + len(errors),
-                "valid_rows": len(transactions),
-                "invalid_rows": len(errors),
-                "errors": errors
-            }
+            workers = min(os.cpu_count() or 1, len(df) // PARALLEL_CSV_ROWS + 1)
+            if workers > 1:
+                result = DataProcessor._validate_frame_parallel(df, company_id, workers, as_records)
+            else:
+                result = DataProcessor._validate_frame(df, company_id, as_records)
             
             logger.info(
-                f"Parsed CSV: {len(transactions)} valid, {len(errors)} invalid",
+                f"Parsed CSV: {result['valid_rows']} valid, {result['invalid_rows']} invalid",
                 extra={
                     "company_id": company_id,
-                    "valid_count": len(transactions),
-                    "error_count": len(errors)
+                    "valid_count": result["valid_rows"],
+                    "error_count": result["invalid_rows"]
                 }
             )
             
@@ -120,80 +232,324 @@ class DataProcessor:
             }
     
     @staticmethod
-    def _validate_transaction_row(
-        row: Dict[str, str],
+    def parse_csv_iter(
+        csv_content: Union[str, IO[str]],
         company_id: int,
-        row_num: int
-    ) -> Dict[str, Any]:
+        chunk_size: int = CSV_CHUNK_ROWS,
+        as_records: bool = False
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Validate a single transaction row.
+        Parse and validate CSV content one chunk of rows at a time.
+        
+        Only the current chunk is held in memory, so large uploads can be
+        streamed from a file object. Row numbers in errors count from the
+        start of the file.
         
         Args:
-            row: CSV row as dictionary
-            company_id: Company ID
-            row_num: Row number for error reporting
+            csv_content: CSV file content as string or text file object
+            company_id: ID of the company
+            chunk_size: Rows per chunk
+            as_records: Return transactions as TransactionRecord objects
+                instead of dictionaries
             
-        Returns:
-            Dictionary with validation result
+        Yields:
+            Dictionaries shaped like parse_csv results, one per chunk (a
+            single failure dictionary if the CSV cannot be read)
         """
         try:
-            # Validate and parse date
-            date_result = DataProcessor.parse_date(row["date"])
-            if not date_result["valid"]:
-                return {
-                    "valid": False,
-                    "error": f"Invalid date: {date_result['error']}"
-                }
+            logger.info(f"Parsing CSV in chunks for company {company_id}")
             
-            # Validate and parse amount
-            amount_result = DataProcessor.validate_amount(row["amount"])
-            if not amount_result["valid"]:
-                return {
-                    "valid": False,
-                    "error": f"Invalid amount: {amount_result['error']}"
-                }
+            try:
+                chunks = DataProcessor._read_csv(csv_content, chunk_size)
+            except pd.errors.EmptyDataError:
+                chunks = [None]
+            
+            for df in chunks:
+                error = DataProcessor._check_columns(df)
+                if error:
+                    yield {
+                        "success": False,
+                        "error": error,
+                        "transactions": []
+                    }
+                    return
+                
+                yield DataProcessor._validate_frame(df, company_id, as_records)
+                
+        except Exception as e:
+            logger.error(f"Error parsing CSV: {e}", exc_info=True)
+            yield {
+                "success": False,
+                "error": f"Failed to parse CSV: {str(e)}",
+                "transactions": []
+            }
+    
+    @staticmethod
+    def _read_csv(
+        csv_content: Union[str, IO[str]],
+        chunk_size: Optional[int] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Load the known columns of a CSV as raw strings.
+        
+        Args:
+            csv_content: CSV file content as string or text file object
+            chunk_size: If given, return an iterator of frames of this many rows
             
-            # Validate type
-            transaction_type = row["type"].strip().lower()
-            if transaction_type not in DataProcessor.VALID_TYPES:
-                return {
-                    "valid": False,
-                    "error": f"Invalid type: must be 'income' or 'expense', got '{transaction_type}'"
-                }
+        Returns:
+            DataFrame, or iterator of DataFrames when chunk_size is given
             
-            # Validate category (not empty)
-            category = row["category"].strip()
-            if not category:
-                return {
-                    "valid": False,
-                    "error": "Category cannot be empty"
-                }
+        Raises:
+            pandas.errors.EmptyDataError: If the CSV has no header
+        """
+        if isinstance(csv_content, str):
+            csv_content = io.StringIO(csv_content)
+        
+        return pd.read_csv(
+            csv_content,
+            dtype=str,
+            keep_default_na=False,
+            # Rows with trailing commas have more fields than the header;
+            # never let pandas turn the first column into the index
+            index_col=False,
+            usecols=lambda column: column in DataProcessor._KNOWN_SET,
+            chunksize=chunk_size
+        )
+    
+    @staticmethod
+    def _check_columns(df: Optional[pd.DataFrame]) -> Optional[str]:
+        """
+        Check that a parsed CSV has all required columns.
+        
+        Args:
+            df: Parsed CSV, or None if it had no header
             
-            # Build transaction object
-            transaction = {
-                "company_id": company_id,
-                "date": date_result["date"].isoformat(),
-                "amount": amount_result["amount"],
-                "category": category,
-                "type": transaction_type,
-                "description": row.get("description", "").strip()
-            }
+        Returns:
+            Error message, or None if the columns are fine
+        """
+        if df is None:
+            return "CSV file is empty or has no headers"
+        
+        missing_cols = DataProcessor._REQUIRED_SET.difference(df.columns)
+        if missing_cols:
+            return f"Missing required columns: {', '.join(missing_cols)}"
+        
+        return None
+    
+    @staticmethod
+    def _validate_frame(
+        df: pd.DataFrame,
+        company_id: int,
+        as_records: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate the rows of a parsed CSV.
+        
+        Args:
+            df: CSV rows as raw strings, indexed by data row position
+            company_id: ID of the company
+            as_records: Build TransactionRecord objects instead of dictionaries
             
-            return {
-                "valid": True,
-                "transaction": transaction
+        Returns:
+            Dictionary with parsed transactions and validation results
+        """
+        # Validate every column at once; rows the fast paths reject are
+        # re-checked with the scalar validators so results and messages
+        # match them exactly
+        dates, date_errors = DataProcessor._parse_date_column(df["date"])
+        amounts, amount_errors = DataProcessor._parse_amount_column(df["amount"])
+        
+        types = df["type"].str.strip().str.lower()
+        categories = df["category"].str.strip()
+        if "description" in df.columns:
+            descriptions = df["description"].str.strip()
+        else:
+            descriptions = pd.Series("", index=df.index)
+        
+        # Report one error per row: date, then amount, then type, then category
+        # (later assignments take precedence)
+        row_errors = np.full(len(df), None, dtype=object)
+        row_errors[(categories == "").to_numpy()] = "Category cannot be empty"
+        bad_type = ~types.isin(DataProcessor.VALID_TYPES).to_numpy()
+        row_errors[bad_type] = [
+            f"Invalid type: must be 'income' or 'expense', got '{t}'"
+            for t in types[bad_type]
+        ]
+        has_amount_error = pd.notna(amount_errors)
+        row_errors[has_amount_error] = [
+            f"Invalid amount: {error}" for error in amount_errors[has_amount_error]
+        ]
+        has_date_error = pd.notna(date_errors)
+        row_errors[has_date_error] = [
+            f"Invalid date: {error}" for error in date_errors[has_date_error]
+        ]
+        
+        # Process rows, normalized the same way as clean_transactions
+        valid = pd.isna(row_errors)
+        fields = zip(
+            dates[valid].tolist(),
+            amounts[valid].tolist(),
+            categories[valid].str.title().tolist(),
+            types[valid].tolist(),
+            descriptions[valid].tolist()
+        )
+        if as_records:
+            transactions = [
+                TransactionRecord(
+                    company_id, date, round(amount, 2), category, transaction_type, description
+                )
+                for date, amount, category, transaction_type, description in fields
+            ]
+        else:
+            transactions = [
+                {
+                    "company_id": company_id,
+                    "date": date,
+                    "amount": round(amount, 2),
+                    "category": category,
+                    "type": transaction_type,
+                    "description": description
+                }
+                for date, amount, category, transaction_type, description in fields
+            ]
+        
+        invalid = np.flatnonzero(~valid)
+        rows = df.iloc[invalid].to_dict("records")
+        errors = [
+            {
+                "row": int(df.index[i]) + 2,  # Row 1 is the header
+                "error": row_errors[i],
+                "data": row
             }
+            for i, row in zip(invalid, rows)
+        ]
+        
+        return DataProcessor._build_result(transactions, errors)
+    
+    @staticmethod
+    def _validate_frame_parallel(
+        df: pd.DataFrame,
+        company_id: int,
+        workers: int,
+        as_records: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate the rows of a large parsed CSV across worker processes.
+        
+        Args:
+            df: CSV rows as raw strings, indexed by data row position
+            company_id: ID of the company
+            workers: Number of worker processes (and slices of df)
+            as_records: Build TransactionRecord objects instead of dictionaries
             
-        except KeyError as e:
-            return {
-                "valid": False,
-                "error": f"Missing required field: {e}"
-            }
-        except Exception as e:
-            return {
-                "valid": False,
-                "error": f"Validation error: {str(e)}"
-            }
+        Returns:
+            Dictionary with parsed transactions and validation results
+        """
+        bounds = np.linspace(0, len(df), workers + 1, dtype=int)
+        frames = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_validate_chunk, frames, repeat(company_id), repeat(as_records)))
+        
+        return DataProcessor._build_result(
+            [t for part in parts for t in part["transactions"]],
+            [e for part in parts for e in part["errors"]]
+        )
+    
+    @staticmethod
+    def _build_result(
+        transactions: List[Dict[str, Any]],
+        errors: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Build a parse_csv result from valid transactions and row errors.
+        
+        Args:
+            transactions: Valid transactions
+            errors: Row errors
+            
+        Returns:
+            Dictionary with parsed transactions and validation results
+        """
+        return {
+            "success": len(transactions) > 0,
+            "transactions": transactions,
+            "total_rows": len(transactions) + len(errors),
+            "valid_rows": len(transactions),
+            "invalid_rows": len(errors),
+            "errors": errors
+        }
+    
+    @staticmethod
+    def _parse_date_column(raw: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parse a column of date strings to ISO datetime strings.
+        
+        YYYY-MM-DD values are parsed in one vectorized pass; anything else
+        goes through parse_date once per distinct value.
+        
+        Args:
+            raw: Date strings as read from the CSV
+            
+        Returns:
+            Tuple of (ISO strings or None, error messages or None) per row
+        """
+        stripped = raw.str.strip()
+        parsed = pd.to_datetime(stripped, format="%Y-%m-%d", errors="coerce")
+        
+        dates = np.full(len(raw), None, dtype=object)
+        errors = np.full(len(raw), None, dtype=object)
+        
+        ok = parsed.notna().to_numpy()
+        dates[ok] = parsed[ok].to_numpy().astype("datetime64[s]").astype(str)
+        
+        leftovers = np.flatnonzero(~ok)
+        if len(leftovers):
+            # Each distinct value is parsed and formatted once
+            results = {}
+            for value in stripped.iloc[leftovers].unique():
+                iso = _iso_date_cached(value)
+                error = None if iso is not None else DataProcessor.parse_date(value)["error"]
+                results[value] = (iso, error)
+            for i, value in zip(leftovers, stripped.iloc[leftovers]):
+                dates[i], errors[i] = results[value]
+        
+        return dates, errors
+    
+    @staticmethod
+    def _parse_amount_column(raw: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parse a column of amount strings to floats.
+        
+        Plain numbers are checked by validate_amount_series; anything else
+        (blanks, NaN, exotic notations) and values at the edges of the valid
+        range go through validate_amount.
+        
+        Args:
+            raw: Amount strings as read from the CSV
+            
+        Returns:
+            Tuple of (float amounts, error messages or None) per row
+        """
+        amounts, _ = DataProcessor.validate_amount_series(raw)
+        errors = np.full(len(raw), None, dtype=object)
+        
+        errors[amounts < 0] = "Amount must be positive (use 'type' field to indicate income/expense)"
+        errors[amounts > MAX_AMOUNT] = "Amount exceeds maximum value"
+        
+        # Zero and the maximum may be rounded from values just outside the
+        # range (e.g. "-1e-400"), so the exact Decimal check decides them
+        recheck = np.isnan(amounts) | (amounts == 0) | (amounts == MAX_AMOUNT)
+        for i in np.flatnonzero(recheck):
+            result = DataProcessor.validate_amount(raw.iat[i])
+            if result["valid"]:
+                amounts[i] = result["amount"]
+                errors[i] = None
+            else:
+                amounts[i] = np.nan
+                errors[i] = result["error"]
+        
+        return amounts, errors
     
     @staticmethod
     def parse_date(date_str: str) -> Dict[str, Any]:
@@ -211,26 +567,15 @@ class DataProcessor:
         Returns:
             Dictionary with parsed date or error
         """
-        date_formats = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%d-%m-%Y",
-            "%Y/%m/%d",
-            "%d/%m/%Y"
-        ]
-        
         date_str = date_str.strip()
         
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                return {
-                    "valid": True,
-                    "date": parsed_date,
-                    "format": fmt
-                }
-            except ValueError:
-                continue
+        parsed = _parse_date_cached(date_str)
+        if parsed is not None:
+            return {
+                "valid": True,
+                "date": parsed[0],
+                "format": parsed[1]
+            }
         
         return {
             "valid": False,
@@ -250,12 +595,16 @@ class DataProcessor:
         """
         try:
             # Clean the amount string
-            cleaned = amount_str.strip()
-            cleaned = cleaned.replace("$", "")
-            cleaned = cleaned.replace(",", "")
-            cleaned = cleaned.replace(" ", "")
+            cleaned = _AMOUNT_CLEAN_RE.sub("", amount_str.strip())
             
-            # Parse to Decimal for precision
+            if _AMOUNT_SHAPE_RE.fullmatch(cleaned):
+                return {
+                    "valid": True,
+                    "amount": float(cleaned)
+                }
+            
+            # Anything else (signs, exponents, long fractions) is checked
+            # exactly with Decimal
             amount = Decimal(cleaned)
             
             # Validate positive
@@ -283,6 +632,23 @@ class DataProcessor:
                 "error": f"Invalid number format: {str(e)}"
             }
     
+    @staticmethod
+    def validate_amount_series(amounts: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate and parse a column of amount strings in one vectorized pass.
+        
+        Args:
+            amounts: Amount strings (e.g., "1500.00", "$1,500.00")
+            
+        Returns:
+            Tuple of (float values, validity mask); values are NaN where the
+            string is not a number
+        """
+        cleaned = amounts.str.strip().str.replace(_AMOUNT_CLEAN_RE, "", regex=True)
+        values = pd.to_numeric(cleaned, errors="coerce").to_numpy(dtype=np.float64)
+        valid = (values >= 0) & (values <= MAX_AMOUNT)
+        return values, valid
+    
     @staticmethod
     def clean_transactions(
         transactions: List[Dict[str, Any]]
@@ -290,6 +656,9 @@ class DataProcessor:
         """
         Clean and normalize transaction data.
         
+        parse_csv already returns transactions in this form, so only
+        transactions from other sources need cleaning.
+        
         Args:
             transactions: List of transaction dictionaries
             
@@ -342,38 +711,44 @@ class DataProcessor:
             issues = []
             warnings = []
             
-            # Check for required fields
-            for i, transaction in enumerate(transactions):
-                missing = [
-                    field for field in ["company_id", "date", "amount", "category", "type"]
-                    if field not in transaction
-                ]
-                if missing:
-                    issues.append(f"Transaction {i}: Missing fields {missing}")
-            
-            # Check date ranges
-            dates = [
-                datetime.fromisoformat(t["date"])
-                for t in transactions
-                if "date" in t
-            ]
+            # Check for required fields; batches from parse_csv share one
+            # schema, so a single key-view comparison per transaction
+            # normally passes and the per-field scan is skipped
+            required = DataProcessor._BATCH_FIELD_SET
+            if not all(required <= transaction.keys() for transaction in transactions):
+                for i, transaction in enumerate(transactions):
+                    missing = [
+                        field for field in DataProcessor.BATCH_FIELDS
+                        if field not in transaction
+                    ]
+                    if missing:
+                        issues.append(f"Transaction {i}: Missing fields {missing}")
+            
+            # Check date ranges; ISO-8601 strings sort chronologically, so
+            # only the two extremes need parsing
+            dates = [t["date"] for t in transactions if "date" in t]
             
             if dates:
-                oldest = min(dates)
-                newest = max(dates)
+                oldest = datetime.fromisoformat(min(dates))
+                newest = datetime.fromisoformat(max(dates))
                 date_range_days = (newest - oldest).days
                 
                 if date_range_days > 1825:  # 5 years
                     warnings.append(f"Transaction date range spans {date_range_days} days (>5 years)")
             
-            # Check for potential duplicates
-            transaction_keys = []
-            for transaction in transactions:
-                if all(k in transaction for k in ["date", "amount", "category"]):
-                    key = f"{transaction['date']}_{transaction['amount']}_{transaction['category']}"
-                    if key in transaction_keys:
-                        warnings.append(f"Potential duplicate: {key}")
-                    transaction_keys.append(key)
+            # Check for potential duplicates among transactions that have
+            # all key fields
+            keys = pd.DataFrame(transactions, columns=["date", "amount", "category"])
+            keys = keys[keys.notna().all(axis=1)]
+            dupes = keys[keys.duplicated(keep="first")]
+            warnings.extend(
+                f"Potential duplicate: {date}_{amount}_{category}"
+                for date, amount, category in zip(
+                    dupes["date"].tolist(),
+                    dupes["amount"].tolist(),
+                    dupes["category"].tolist()
+                )
+            )
             
             # Check categories
             categories = set(t.get("category") for t in transactions if t.get("category"))
@@ -435,24 +810,26 @@ class DataProcessor:
                     "net": 0.0
                 }
             
-            total_income = sum(
-                float(t["amount"])
-                for t in transactions
-                if t["type"] == "income"
-            )
-            
-            total_expenses = sum(
-                float(t["amount"])
-                for t in transactions
-                if t["type"] == "expense"
-            )
-            
-            categories = set(t["category"] for t in transactions)
-            
-            dates = [
-                datetime.fromisoformat(t["date"])
-                for t in transactions
-            ]
+            # Single pass over the transactions
+            total_income = 0.0
+            total_expenses = 0.0
+            categories = set()
+            date_strs = []
+            
+            for t in transactions:
+                amount = float(t["amount"])
+                transaction_type = t["type"]
+                if transaction_type == "income":
+                    total_income += amount
+                elif transaction_type == "expense":
+                    total_expenses += amount
+                categories.add(t["category"])
+                date_strs.append(t["date"])
+            
+            # ISO-8601 strings sort chronologically, so only the two
+            # extremes need parsing
+            start = datetime.fromisoformat(min(date_strs))
+            end = datetime.fromisoformat(max(date_strs))
             
             return {
                 "count": len(transactions),
@@ -462,8 +839,8 @@ class DataProcessor:
                 "unique_categories": len(categories),
                 "categories": list(categories),
                 "date_range": {
-                    "start": min(dates).isoformat() if dates else None,
-                    "end": max(dates).isoformat() if dates else None
+                    "start": start.isoformat(),
+                    "end": end.isoformat()
                 },
                 "avg_transaction_size": round(
                     (total_income + total_expenses) / len(transactions), 2
@@ -478,6 +855,11 @@ class DataProcessor:
             }
 
 
+def _validate_chunk(df: pd.DataFrame, company_id: int, as_records: bool) -> Dict[str, Any]:
+    """Validate one slice of a parsed CSV (runs in a worker process)."""
+    return DataProcessor._validate_frame(df, company_id, as_records)
+
+
 # Global instance
 data_processor = DataProcessor()
 
@@ -1,13 +1,367 @@
 """Financial calculation tools for agent operations."""
 
+import copy
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
-from decimal import Decimal
-from collections import defaultdict
+import threading
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime, time, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("Numba not installed, using NumPy kernels. Install with: pip install numba")
+
+# Sign per transaction type: +1 income, -1 expense (anything else counts as 0)
+TYPE_SIGN = {"income": 1, "expense": -1}
+
+# Health score lookup tables: a value scores _SCORES[i], where i is the
+# number of _THRESHOLDS it is greater than or equal to
+_RUNWAY_THRESHOLDS = (3, 6, 12, 18)
+_RUNWAY_SCORES = (5, 15, 25, 35, 40)
+_REVENUE_THRESHOLDS = (0, 10, 20)
+_REVENUE_SCORES = (5, 15, 25, 30)
+_EXPENSE_THRESHOLDS = (5, 15, 30)
+_EXPENSE_SCORES = (25, 20, 10, 5)
+_RATING_THRESHOLDS = (20, 40, 60, 80)
+_RATINGS = ("Critical", "Poor", "Fair", "Good", "Excellent")
+
+_RUNWAY_STATUS_THRESHOLDS = (3, 6, 12)
+_RUNWAY_STATUSES = ("critical", "warning", "healthy", "excellent")
+
+_RUNWAY_SCORE_ARRAY = np.array(_RUNWAY_SCORES)
+_REVENUE_SCORE_ARRAY = np.array(_REVENUE_SCORES)
+_EXPENSE_SCORE_ARRAY = np.array(_EXPENSE_SCORES)
+_RATING_ARRAY = np.array(_RATINGS, dtype=object)
+_RUNWAY_STATUS_ARRAY = np.array(_RUNWAY_STATUSES, dtype=object)
+
+# Number of metric results kept per TransactionTable by _cache_get/_cache_put
+RESULT_CACHE_SIZE = 128
+
+
+def _parse_dates(transactions: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Parse transaction dates into a datetime64[D] array.
+    
+    Only the "YYYY-MM-DD" prefix of each date is read.
+    
+    Args:
+        transactions: List of transaction dictionaries with ISO date strings
+        
+    Returns:
+        Array of transaction dates
+    """
+    return np.array([t["date"][:10] for t in transactions], dtype="datetime64[D]")
+
+
+@dataclass
+class TransactionTable:
+    """
+    Column-wise view of a transaction list.
+    
+    Each column is a parallel array indexed by transaction, so calculators
+    scan contiguous dates and amounts instead of a list of dictionaries.
+    Types are stored as TYPE_SIGN codes (1 income, -1 expense, 0 other).
+    Rows are sorted by date, with positions holding each row's index in the
+    source list. Metric results computed from a table are memoized on it, so
+    a table must not be modified after it is built.
+    """
+    dates: np.ndarray
+    amounts: np.ndarray
+    types: np.ndarray
+    categories: np.ndarray
+    positions: np.ndarray
+    _results: "OrderedDict[tuple, Dict[str, Any]]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    
+    @classmethod
+    def from_dicts(cls, transactions: List[Dict[str, Any]]) -> "TransactionTable":
+        """
+        Build a table from transaction dictionaries.
+        
+        Args:
+            transactions: List of transaction dictionaries with date, amount,
+                type and optional category
+                
+        Returns:
+            TransactionTable with one row per transaction, sorted by date
+        """
+        count = len(transactions)
+        categories = np.empty(count, dtype=object)
+        categories[:] = [t.get("category", "Uncategorized") for t in transactions]
+        dates = _parse_dates(transactions)
+        order = np.argsort(dates, kind="stable")
+        
+        return cls(
+            dates=dates[order],
+            amounts=np.array([t["amount"] for t in transactions], dtype=np.float64)[order],
+            types=np.fromiter((TYPE_SIGN.get(t["type"], 0) for t in transactions), dtype=np.int8, count=count)[order],
+            categories=categories[order],
+            positions=order
+        )
+    
+    def __len__(self) -> int:
+        return len(self.amounts)
+    
+    def since(self, day: np.datetime64) -> "TransactionTable":
+        """
+        Get the rows dated on or after a day.
+        
+        Args:
+            day: First day to include
+            
+        Returns:
+            TransactionTable whose columns are views into this one
+        """
+        start = int(np.searchsorted(self.dates, day))
+        return TransactionTable(
+            dates=self.dates[start:],
+            amounts=self.amounts[start:],
+            types=self.types[start:],
+            categories=self.categories[start:],
+            positions=self.positions[start:]
+        )
+
+
+def _as_table(transactions: Union[List[Dict[str, Any]], TransactionTable]) -> TransactionTable:
+    """
+    Get the TransactionTable for transactions.
+    
+    Args:
+        transactions: Transaction dictionaries or an existing table
+        
+    Returns:
+        The table itself, or a new table built from the list
+    """
+    if isinstance(transactions, TransactionTable):
+        return transactions
+    return TransactionTable.from_dicts(transactions)
+
+
+_result_lock = threading.Lock()
+
+
+def _cache_get(transactions: Any, key: tuple) -> Optional[Dict[str, Any]]:
+    """
+    Look up a metric result memoized on a TransactionTable.
+    
+    Only tables are memoized: a list can be edited in place between calls,
+    while a table is treated as immutable and takes its results with it
+    when it is garbage collected.
+    
+    Args:
+        transactions: Transactions the result was computed from
+        key: Cache key (method name and parameters)
+        
+    Returns:
+        Copy of the cached result, or None on a miss
+    """
+    if not isinstance(transactions, TransactionTable):
+        return None
+    with _result_lock:
+        result = transactions._results.get(key)
+        if result is None:
+            return None
+        transactions._results.move_to_end(key)
+    return copy.deepcopy(result)
+
+
+def _cache_put(transactions: Any, key: tuple, result: Dict[str, Any]) -> None:
+    """
+    Memoize a metric result on a TransactionTable, evicting the least
+    recently used entry when full. Lists are not memoized.
+    
+    Args:
+        transactions: Transactions the result was computed from
+        key: Cache key (method name and parameters)
+        result: Result dictionary (a copy is stored)
+    """
+    if not isinstance(transactions, TransactionTable):
+        return
+    with _result_lock:
+        transactions._results[key] = copy.deepcopy(result)
+        transactions._results.move_to_end(key)
+        if len(transactions._results) > RESULT_CACHE_SIZE:
+            transactions._results.popitem(last=False)
+
+
+def _period_totals(
+    months: np.ndarray,
+    amounts: np.ndarray,
+    is_income: np.ndarray
+) -> Tuple[float, float, int]:
+    """
+    Sum income and expenses over a period and count its distinct months.
+    
+    Args:
+        months: Month number per transaction, sorted ascending
+        amounts: Amount per transaction
+        is_income: True for income, False for anything else (expense)
+        
+    Returns:
+        Tuple of (income total, expense total, number of distinct months)
+    """
+    income = float(amounts[is_income].sum())
+    expenses = float(amounts[~is_income].sum())
+    n_months = int(np.count_nonzero(months[1:] != months[:-1])) + 1 if len(months) else 0
+    return income, expenses, n_months
+
+
+if NUMBA_AVAILABLE:
+    # The explicit signature compiles the kernel at import (or loads it from
+    # the on-disk cache) instead of on the first request. Inputs must be
+    # C-contiguous, which lets the loop be vectorized.
+    @njit("Tuple((float64, float64, int64))(int64[::1], float64[::1], boolean[::1])", cache=True)
+    def _period_totals(months, amounts, is_income):
+        income = 0.0
+        expenses = 0.0
+        n_months = 0
+        for i in range(months.size):
+            if i == 0 or months[i] != months[i - 1]:
+                n_months += 1
+            if is_income[i]:
+                income += amounts[i]
+            else:
+                expenses += amounts[i]
+        return income, expenses, n_months
+
+
+def _factor_scores(
+    balances: np.ndarray,
+    burns: np.ndarray,
+    revenue_growth: np.ndarray,
+    expense_growth: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Look up the three health score factors for 1-D scenario arrays.
+    
+    Args:
+        balances: Current cash balances
+        burns: Monthly burn rates
+        revenue_growth: Month-over-month revenue growth %
+        expense_growth: Month-over-month expense growth %
+        
+    Returns:
+        Tuple of (runway, revenue growth, expense control) score arrays
+    """
+    burning = burns > 0
+    runway_months = np.divide(balances, burns, out=np.zeros(balances.shape), where=burning)
+    runway_score = np.where(
+        burning,
+        _RUNWAY_SCORE_ARRAY[np.searchsorted(_RUNWAY_THRESHOLDS, runway_months, side="right")],
+        40
+    )
+    revenue_score = _REVENUE_SCORE_ARRAY[
+        np.searchsorted(_REVENUE_THRESHOLDS, revenue_growth, side="right")
+    ]
+    expense_score = np.where(
+        expense_growth < revenue_growth,
+        30,
+        _EXPENSE_SCORE_ARRAY[np.searchsorted(_EXPENSE_THRESHOLDS, expense_growth, side="right")]
+    )
+    return runway_score, revenue_score, expense_score
+
+
+if NUMBA_AVAILABLE:
+    # Scenarios are independent, so rows are split across threads
+    @njit(
+        "UniTuple(int64[::1], 3)(float64[::1], float64[::1], float64[::1], float64[::1])",
+        parallel=True,
+        cache=True
+    )
+    def _factor_scores(balances, burns, revenue_growth, expense_growth):
+        n = balances.size
+        runway_score = np.empty(n, dtype=np.int64)
+        revenue_score = np.empty(n, dtype=np.int64)
+        expense_score = np.empty(n, dtype=np.int64)
+        # Buckets are counted with "not value < threshold" so NaN lands in
+        # the top bucket, as with bisect_right and np.searchsorted
+        for i in prange(n):
+            if burns[i] > 0:
+                runway_months = balances[i] / burns[i]
+                k = 0
+                while k < len(_RUNWAY_THRESHOLDS) and not runway_months < _RUNWAY_THRESHOLDS[k]:
+                    k += 1
+                runway_score[i] = _RUNWAY_SCORES[k]
+            else:
+                runway_score[i] = 40
+            
+            k = 0
+            while k < len(_REVENUE_THRESHOLDS) and not revenue_growth[i] < _REVENUE_THRESHOLDS[k]:
+                k += 1
+            revenue_score[i] = _REVENUE_SCORES[k]
+            
+            if expense_growth[i] < revenue_growth[i]:
+                expense_score[i] = 30
+            else:
+                k = 0
+                while k < len(_EXPENSE_THRESHOLDS) and not expense_growth[i] < _EXPENSE_THRESHOLDS[k]:
+                    k += 1
+                expense_score[i] = _EXPENSE_SCORES[k]
+        return runway_score, revenue_score, expense_score
+
+
+def _month_index(dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bucket dates by calendar month using integer month numbers.
+    
+    Args:
+        dates: datetime64 array
+        
+    Returns:
+        Tuple of (months, month_idx): the sorted distinct months present, as
+        months since 1970-01, and each date's index into them
+    """
+    if not len(dates):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.intp)
+    
+    months = dates.astype("datetime64[M]").astype(np.int64)
+    first = months.min()
+    offsets = months - first
+    present = np.bincount(offsets) > 0
+    month_idx = (np.cumsum(present) - 1).astype(np.intp)[offsets]
+    return np.flatnonzero(present) + first, month_idx
+
+
+def _month_label(month: int) -> str:
+    """Format a month number (months since 1970-01) as "YYYY-MM"."""
+    year, month = divmod(month, 12)
+    return f"{1970 + year:04d}-{month + 1:02d}"
+
+
+def _cutoff_day(period_months: int, now: Optional[datetime] = None) -> np.datetime64:
+    """
+    Get the first day of a trailing period of calendar months.
+    
+    The cutoff is now minus period_months calendar months, rounded up to the
+    next whole day. Comparing day-resolution dates against it gives the same
+    result as comparing the timestamps for dates stored without a time of
+    day.
+    
+    Args:
+        period_months: Length of the period in months
+        now: Current UTC time (default datetime.utcnow())
+        
+    Returns:
+        Cutoff as a datetime64[D]
+    """
+    cutoff_date = (now or datetime.utcnow()) - relativedelta(months=period_months)
+    day = np.datetime64(cutoff_date.date(), "D")
+    if cutoff_date != datetime.combine(cutoff_date.date(), time.min):
+        day += 1
+    return day
+
 
 class FinancialCalculator:
     """
@@ -24,8 +378,9 @@ class FinancialCalculator:
     
     @staticmethod
     def calculate_burn_rate(
-        transactions: List[Dict[str, Any]],
-        period_months: int = 3
+        transactions: Union[List[Dict[str, Any]], TransactionTable],
+        period_months: int = 3,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Calculate the monthly burn rate based on recent transactions.
@@ -34,7 +389,9 @@ class FinancialCalculator:
         
         Args:
             transactions: List of transaction dictionaries with date, amount, type
+                (or a TransactionTable)
             period_months: Number of months to analyze (default 3)
+            now: Current UTC time (default datetime.utcnow())
             
         Returns:
             Dictionary with burn rate metrics
@@ -50,31 +407,30 @@ class FinancialCalculator:
                     "transaction_count": 0
                 }
             
-            # Filter to recent period
-            cutoff_date = datetime.utcnow() - timedelta(days=period_months * 30)
-            recent_transactions = [
-                t for t in transactions
-                if datetime.fromisoformat(t["date"].replace("Z", "+00:00")) >= cutoff_date
-            ]
-            
-            # Calculate monthly totals
-            monthly_income = defaultdict(float)
-            monthly_expenses = defaultdict(float)
+            cutoff_day = _cutoff_day(period_months, now)
+            cache_key = ("burn_rate", period_months, cutoff_day)
+            cached = _cache_get(transactions, cache_key)
+            if cached is not None:
+                return cached
             
-            for transaction in recent_transactions:
-                date = datetime.fromisoformat(transaction["date"].replace("Z", "+00:00"))
-                month_key = date.strftime("%Y-%m")
-                amount = float(transaction["amount"])
-                
-                if transaction["type"] == "income":
-                    monthly_income[month_key] += amount
-                else:  # expense
-                    monthly_expenses[month_key] += amount
+            # Filter to recent period
+            recent = _as_table(transactions).since(cutoff_day)
+            amounts = recent.amounts
+            is_income = recent.types > 0
+            
+            # Only the period totals and the number of distinct months are
+            # needed, so no per-month buckets are built (anything that is
+            # not income counts as expense)
+            total_income, total_expenses, months_seen = _period_totals(
+                recent.dates.astype("datetime64[M]").astype(np.int64),
+                np.ascontiguousarray(amounts),
+                is_income
+            )
             
             # Calculate averages
-            num_months = max(len(monthly_income), len(monthly_expenses), 1)
-            avg_monthly_income = sum(monthly_income.values()) / num_months
-            avg_monthly_expenses = sum(monthly_expenses.values()) / num_months
+            num_months = max(months_seen, 1)
+            avg_monthly_income = total_income / num_months
+            avg_monthly_expenses = total_expenses / num_months
             net_burn = avg_monthly_expenses - avg_monthly_income
             
             result = {
@@ -83,12 +439,13 @@ class FinancialCalculator:
                 "avg_monthly_income": round(avg_monthly_income, 2),
                 "net_burn": round(net_burn, 2),
                 "period_months": period_months,
-                "transaction_count": len(recent_transactions),
+                "transaction_count": len(recent),
                 "months_analyzed": num_months
             }
+            _cache_put(transactions, cache_key, result)
             
             logger.debug(
-                f"Calculated burn rate",
+                "Calculated burn rate",
                 extra={"burn_rate": result["burn_rate"], "months": num_months}
             )
             
@@ -104,7 +461,8 @@ class FinancialCalculator:
     @staticmethod
     def calculate_runway(
         current_balance: float,
-        monthly_burn_rate: float
+        monthly_burn_rate: float,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Calculate runway (months until cash runs out).
@@ -114,6 +472,7 @@ class FinancialCalculator:
         Args:
             current_balance: Current cash balance
             monthly_burn_rate: Monthly burn rate (should be positive for negative cash flow)
+            now: Current UTC time (default datetime.utcnow())
             
         Returns:
             Dictionary with runway metrics
@@ -133,17 +492,10 @@ class FinancialCalculator:
             runway_days = runway_months * 30
             
             # Calculate estimated depletion date
-            depletion_date = datetime.utcnow() + timedelta(days=runway_days)
+            depletion_date = (now or datetime.utcnow()) + timedelta(days=runway_days)
             
             # Determine health status
-            if runway_months < 3:
-                status = "critical"
-            elif runway_months < 6:
-                status = "warning"
-            elif runway_months < 12:
-                status = "healthy"
-            else:
-                status = "excellent"
+            status = _RUNWAY_STATUSES[bisect_right(_RUNWAY_STATUS_THRESHOLDS, runway_months)]
             
             result = {
                 "runway_months": round(runway_months, 2),
@@ -155,7 +507,7 @@ class FinancialCalculator:
             }
             
             logger.debug(
-                f"Calculated runway",
+                "Calculated runway",
                 extra={"runway_months": result["runway_months"], "status": status}
             )
             
@@ -168,58 +520,124 @@ class FinancialCalculator:
                 "runway_months": 0.0
             }
     
+    @staticmethod
+    def calculate_runway_vec(
+        current_balances: Any,
+        monthly_burn_rates: Any,
+        now: Optional[datetime] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate runway for many balance/burn-rate scenarios at once.
+        
+        Each element follows calculate_runway: non-positive burn rates give an
+        infinite runway with status "positive_cash_flow" and no depletion
+        date. Inputs are broadcast against each other.
+        
+        Args:
+            current_balances: Current cash balances
+            monthly_burn_rates: Monthly burn rates
+            now: Current UTC time (default datetime.utcnow())
+            
+        Returns:
+            Dictionary of arrays: runway_months, runway_days,
+            estimated_depletion_date (datetime64[D], NaT when there is none)
+            and status
+        """
+        balances, burns = np.broadcast_arrays(
+            np.asarray(current_balances, dtype=np.float64),
+            np.asarray(monthly_burn_rates, dtype=np.float64)
+        )
+        
+        burning = burns > 0
+        runway_months = np.divide(balances, burns, out=np.full(balances.shape, np.inf), where=burning)
+        runway_days = runway_months * 30
+        
+        # Depletion dates past the datetime64 range are left as NaT
+        start = np.datetime64(now or datetime.utcnow(), "us")
+        max_days = (np.datetime64("9999-12-31", "D") - start.astype("datetime64[D]")).astype(np.float64)
+        has_date = burning & (runway_days < max_days)
+        offsets = np.where(has_date, runway_days, 0) * 86_400_000_000
+        depletion = (start + offsets.astype("timedelta64[us]")).astype("datetime64[D]")
+        depletion[~has_date] = np.datetime64("NaT")
+        
+        status = np.where(
+            burning,
+            _RUNWAY_STATUS_ARRAY[np.searchsorted(_RUNWAY_STATUS_THRESHOLDS, runway_months, side="right")],
+            "positive_cash_flow"
+        )
+        
+        return {
+            "runway_months": runway_months,
+            "runway_days": runway_days,
+            "estimated_depletion_date": depletion,
+            "status": status
+        }
+    
     @staticmethod
     def analyze_spending_by_category(
-        transactions: List[Dict[str, Any]],
-        period_months: Optional[int] = None
+        transactions: Union[List[Dict[str, Any]], TransactionTable],
+        period_months: Optional[int] = None,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Analyze spending breakdown by category.
         
         Args:
-            transactions: List of transaction dictionaries
+            transactions: List of transaction dictionaries (or a TransactionTable)
             period_months: Optional period to analyze (None = all time)
+            now: Current UTC time (default datetime.utcnow())
             
         Returns:
             Dictionary with category breakdown
         """
         try:
-            # Filter by period if specified
+            cutoff_day = None
             if period_months:
-                cutoff_date = datetime.utcnow() - timedelta(days=period_months * 30)
-                transactions = [
-                    t for t in transactions
-                    if datetime.fromisoformat(t["date"].replace("Z", "+00:00")) >= cutoff_date
-                ]
-            
-            # Group by category
-            category_totals = defaultdict(float)
-            category_counts = defaultdict(int)
-            total_expenses = 0.0
-            total_income = 0.0
-            
-            for transaction in transactions:
-                amount = float(transaction["amount"])
-                category = transaction.get("category", "Uncategorized")
-                
-                if transaction["type"] == "expense":
-                    category_totals[category] += amount
-                    category_counts[category] += 1
-                    total_expenses += amount
-                else:
-                    total_income += amount
+                cutoff_day = _cutoff_day(period_months, now)
+            cache_key = ("spending_by_category", period_months, cutoff_day)
+            cached = _cache_get(transactions, cache_key)
+            if cached is not None:
+                return cached
+            
+            table = _as_table(transactions)
+            
+            # Filter by period if specified
+            if cutoff_day is not None:
+                table = table.since(cutoff_day)
+            amounts = table.amounts
+            
+            # Group expenses by category code
+            is_expense = table.types < 0
+            expense_amounts = amounts[is_expense]
+            codes, names = pd.factorize(table.categories[is_expense], use_na_sentinel=False)
+            totals = np.bincount(codes, weights=expense_amounts, minlength=len(names))
+            counts = np.bincount(codes, minlength=len(names))
+            
+            # List categories in order of first appearance in the source
+            # list, so ties in the sort below keep their input order
+            first_seen = np.full(len(names), np.iinfo(np.intp).max)
+            np.minimum.at(first_seen, codes, table.positions[is_expense])
+            by_appearance = np.argsort(first_seen)
+            names = names[by_appearance]
+            totals = totals[by_appearance]
+            counts = counts[by_appearance]
+            total_expenses = float(expense_amounts.sum())
+            total_income = float(amounts[~is_expense].sum())
             
             # Calculate percentages
-            categories = []
-            for category, total in category_totals.items():
-                percentage = (total / total_expenses * 100) if total_expenses > 0 else 0
-                categories.append({
+            percentages = totals / total_expenses * 100 if total_expenses > 0 else np.zeros(len(names))
+            categories = [
+                {
                     "category": category,
                     "total": round(total, 2),
-                    "count": category_counts[category],
+                    "count": count,
                     "percentage": round(percentage, 2),
-                    "avg_per_transaction": round(total / category_counts[category], 2)
-                })
+                    "avg_per_transaction": round(total / count, 2)
+                }
+                for category, total, count, percentage in zip(
+                    names.tolist(), totals.tolist(), counts.tolist(), percentages.tolist()
+                )
+            ]
             
             # Sort by total descending
             categories.sort(key=lambda x: x["total"], reverse=True)
@@ -229,12 +647,13 @@ class FinancialCalculator:
                 "total_expenses": round(total_expenses, 2),
                 "total_income": round(total_income, 2),
                 "net_position": round(total_income - total_expenses, 2),
-                "transaction_count": len(transactions),
+                "transaction_count": len(amounts),
                 "period_months": period_months or "all_time"
             }
+            _cache_put(transactions, cache_key, result)
             
             logger.debug(
-                f"Analyzed spending by category",
+                "Analyzed spending by category",
                 extra={"category_count": len(categories), "total_expenses": total_expenses}
             )
             
@@ -250,30 +669,25 @@ class FinancialCalculator:
     @staticmethod
     def calculate_balance(
         initial_capital: float,
-        transactions: List[Dict[str, Any]]
+        transactions: Union[List[Dict[str, Any]], TransactionTable]
     ) -> Dict[str, Any]:
         """
         Calculate current balance based on initial capital and transactions.
         
         Args:
             initial_capital: Starting capital
-            transactions: List of all transactions
+            transactions: List of all transactions (or a TransactionTable)
             
         Returns:
             Dictionary with balance information
         """
         try:
-            total_income = sum(
-                float(t["amount"])
-                for t in transactions
-                if t["type"] == "income"
-            )
+            table = _as_table(transactions)
+            amounts = table.amounts
+            signs = table.types
             
-            total_expenses = sum(
-                float(t["amount"])
-                for t in transactions
-                if t["type"] == "expense"
-            )
+            total_income = float(amounts[signs > 0].sum())
+            total_expenses = float(amounts[signs < 0].sum())
             
             current_balance = initial_capital + total_income - total_expenses
             
@@ -287,7 +701,7 @@ class FinancialCalculator:
             }
             
             logger.debug(
-                f"Calculated balance",
+                "Calculated balance",
                 extra={"current_balance": result["current_balance"]}
             )
             
@@ -302,47 +716,52 @@ class FinancialCalculator:
     
     @staticmethod
     def calculate_growth_rate(
-        transactions: List[Dict[str, Any]],
+        transactions: Union[List[Dict[str, Any]], TransactionTable],
         metric: str = "income",
-        period_months: int = 6
+        period_months: int = 6,
+        now: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Calculate month-over-month growth rate.
         
         Args:
-            transactions: List of transactions
+            transactions: List of transactions (or a TransactionTable)
             metric: "income" or "expenses"
             period_months: Number of months to analyze
+            now: Current UTC time (default datetime.utcnow())
             
         Returns:
             Dictionary with growth rate metrics
         """
         try:
+            cutoff_day = _cutoff_day(period_months, now)
+            cache_key = ("growth_rate", metric, period_months, cutoff_day)
+            cached = _cache_get(transactions, cache_key)
+            if cached is not None:
+                return cached
+            
             # Filter to recent period
-            cutoff_date = datetime.utcnow() - timedelta(days=period_months * 30)
-            transactions = [
-                t for t in transactions
-                if datetime.fromisoformat(t["date"].replace("Z", "+00:00")) >= cutoff_date
-                and t["type"] == metric
+            recent = _as_table(transactions).since(cutoff_day)
+            selected = recent.types == TYPE_SIGN.get(metric)
+            amounts = recent.amounts[selected]
+            
+            # Group by month (months come back sorted)
+            months, month_idx = _month_index(recent.dates[selected])
+            totals = np.bincount(month_idx, weights=amounts, minlength=len(months))
+            sorted_months = [
+                (_month_label(month), total)
+                for month, total in zip(months.tolist(), totals.tolist())
             ]
             
-            # Group by month
-            monthly_totals = defaultdict(float)
-            for transaction in transactions:
-                date = datetime.fromisoformat(transaction["date"].replace("Z", "+00:00"))
-                month_key = date.strftime("%Y-%m")
-                monthly_totals[month_key] += float(transaction["amount"])
-            
-            # Sort months
-            sorted_months = sorted(monthly_totals.items())
-            
             if len(sorted_months) < 2:
-                return {
+                result = {
                     "growth_rate": 0.0,
                     "metric": metric,
                     "period_months": period_months,
                     "insufficient_data": True
                 }
+                _cache_put(transactions, cache_key, result)
+                return result
             
             # Calculate average growth rate
             growth_rates = []
@@ -367,9 +786,10 @@ class FinancialCalculator:
                 ],
                 "trend": "increasing" if avg_growth_rate > 0 else "decreasing"
             }
+            _cache_put(transactions, cache_key, result)
             
             logger.debug(
-                f"Calculated growth rate",
+                "Calculated growth rate",
                 extra={"growth_rate": result["growth_rate"], "metric": metric}
             )
             
@@ -402,68 +822,32 @@ class FinancialCalculator:
             Dictionary with health score and breakdown
         """
         try:
-            score = 0
-            factors = {}
-            
             # Factor 1: Runway (max 40 points)
             if monthly_burn_rate > 0:
                 runway_months = current_balance / monthly_burn_rate
-                if runway_months >= 18:
-                    runway_score = 40
-                elif runway_months >= 12:
-                    runway_score = 35
-                elif runway_months >= 6:
-                    runway_score = 25
-                elif runway_months >= 3:
-                    runway_score = 15
-                else:
-                    runway_score = 5
+                runway_score = _RUNWAY_SCORES[bisect_right(_RUNWAY_THRESHOLDS, runway_months)]
             else:
                 runway_score = 40  # Positive cash flow
             
-            factors["runway_score"] = runway_score
-            score += runway_score
-            
             # Factor 2: Revenue Growth (max 30 points)
-            if revenue_growth_rate >= 20:
-                revenue_score = 30
-            elif revenue_growth_rate >= 10:
-                revenue_score = 25
-            elif revenue_growth_rate >= 0:
-                revenue_score = 15
-            else:
-                revenue_score = 5
-            
-            factors["revenue_growth_score"] = revenue_score
-            score += revenue_score
+            revenue_score = _REVENUE_SCORES[bisect_right(_REVENUE_THRESHOLDS, revenue_growth_rate)]
             
             # Factor 3: Expense Control (max 30 points)
             # Lower expense growth is better
             if expense_growth_rate < revenue_growth_rate:
                 expense_score = 30  # Expenses growing slower than revenue
-            elif expense_growth_rate < 5:
-                expense_score = 25
-            elif expense_growth_rate < 15:
-                expense_score = 20
-            elif expense_growth_rate < 30:
-                expense_score = 10
             else:
-                expense_score = 5
+                expense_score = _EXPENSE_SCORES[bisect_right(_EXPENSE_THRESHOLDS, expense_growth_rate)]
             
-            factors["expense_control_score"] = expense_score
-            score += expense_score
+            factors = {
+                "runway_score": runway_score,
+                "revenue_growth_score": revenue_score,
+                "expense_control_score": expense_score
+            }
+            score = runway_score + revenue_score + expense_score
             
             # Determine rating
-            if score >= 80:
-                rating = "Excellent"
-            elif score >= 60:
-                rating = "Good"
-            elif score >= 40:
-                rating = "Fair"
-            elif score >= 20:
-                rating = "Poor"
-            else:
-                rating = "Critical"
+            rating = _RATINGS[bisect_right(_RATING_THRESHOLDS, score)]
             
             result = {
                 "health_score": score,
@@ -475,7 +859,7 @@ class FinancialCalculator:
             }
             
             logger.debug(
-                f"Calculated financial health score",
+                "Calculated financial health score",
                 extra={"score": score, "rating": rating}
             )
             
@@ -488,6 +872,106 @@ class FinancialCalculator:
                 "health_score": 0
             }
     
+    @staticmethod
+    def calculate_dashboard(
+        transactions: Union[List[Dict[str, Any]], TransactionTable],
+        current_balance: float,
+        period_months: int = 6,
+        burn_period_months: int = 3,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculate burn rate, runway, growth rates and health score together.
+        
+        The transactions are converted to a TransactionTable once and every
+        metric is computed from that table, so the list is only walked once.
+        
+        Args:
+            transactions: List of transaction dictionaries (or a TransactionTable)
+            current_balance: Current cash balance
+            period_months: Number of months for the growth rates (default 6)
+            burn_period_months: Number of months for the burn rate (default 3)
+            now: Current UTC time (default datetime.utcnow()); shared by all metrics
+            
+        Returns:
+            Dictionary with burn_rate, runway, income_growth, expense_growth
+            and health_score results
+        """
+        try:
+            table = _as_table(transactions)
+            now = now or datetime.utcnow()
+            
+            burn_rate = FinancialCalculator.calculate_burn_rate(table, burn_period_months, now=now)
+            monthly_burn_rate = burn_rate.get("burn_rate", 0.0)
+            income_growth = FinancialCalculator.calculate_growth_rate(table, "income", period_months, now=now)
+            expense_growth = FinancialCalculator.calculate_growth_rate(table, "expense", period_months, now=now)
+            
+            return {
+                "burn_rate": burn_rate,
+                "runway": FinancialCalculator.calculate_runway(current_balance, monthly_burn_rate, now=now),
+                "income_growth": income_growth,
+                "expense_growth": expense_growth,
+                "health_score": FinancialCalculator.calculate_financial_health_score(
+                    current_balance,
+                    monthly_burn_rate,
+                    income_growth.get("growth_rate", 0.0),
+                    expense_growth.get("growth_rate", 0.0)
+                )
+            }
+            
+        except Exception as e:
+            logger.error(f"Error calculating dashboard: {e}", exc_info=True)
+            return {
+                "error": str(e)
+            }
+    
+    @staticmethod
+    def calculate_financial_health_score_batch(
+        current_balances: Any,
+        monthly_burn_rates: Any,
+        revenue_growth_rates: Any,
+        expense_growth_rates: Any
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate financial health scores for many scenarios at once.
+        
+        Scores each element the same way as calculate_financial_health_score;
+        inputs are broadcast against each other.
+        
+        Args:
+            current_balances: Current cash balances
+            monthly_burn_rates: Monthly burn rates
+            revenue_growth_rates: Month-over-month revenue growth %
+            expense_growth_rates: Month-over-month expense growth %
+            
+        Returns:
+            Dictionary of arrays: health_score, rating and the three factor scores
+        """
+        balances, burns, revenue_growth, expense_growth = np.broadcast_arrays(
+            np.asarray(current_balances, dtype=np.float64),
+            np.asarray(monthly_burn_rates, dtype=np.float64),
+            np.asarray(revenue_growth_rates, dtype=np.float64),
+            np.asarray(expense_growth_rates, dtype=np.float64)
+        )
+        
+        shape = balances.shape
+        runway_score, revenue_score, expense_score = (
+            scores.reshape(shape)
+            for scores in _factor_scores(
+                *(np.ascontiguousarray(values).ravel()
+                  for values in (balances, burns, revenue_growth, expense_growth))
+            )
+        )
+        score = runway_score + revenue_score + expense_score
+        
+        return {
+            "health_score": score,
+            "rating": _RATING_ARRAY[np.searchsorted(_RATING_THRESHOLDS, score, side="right")],
+            "runway_score": runway_score,
+            "revenue_growth_score": revenue_score,
+            "expense_control_score": expense_score
+        }
+    
     @staticmethod
     def _get_recommendations(
         runway_score: int,
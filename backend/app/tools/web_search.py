@@ -1,7 +1,8 @@
 """Web search tool for investment research and market data."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 import httpx
 from datetime import datetime
 
@@ -18,6 +19,223 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+# Curated advice by topic bucket; entries are shared and must not be mutated
+_FINANCIAL_ADVICE = {
+    "runway": [
+        {
+            "advice": "Maintain 12-18 months of runway",
+            "rationale": "Provides buffer for unexpected challenges and fundraising cycles",
+            "source": "VC best practices"
+        },
+        {
+            "advice": "Start fundraising at 6-9 months runway",
+            "rationale": "Fundraising takes 3-6 months on average; don't wait until critical",
+            "source": "Y Combinator guidance"
+        },
+        {
+            "advice": "Track runway weekly",
+            "rationale": "Early detection of problems allows for corrective action",
+            "source": "CFO best practices"
+        }
+    ],
+    "burn_rate": [
+        {
+            "advice": "Reduce burn rate when approaching critical runway",
+            "rationale": "Preserve cash to extend runway and maintain operations",
+            "source": "Financial management"
+        },
+        {
+            "advice": "Focus on revenue growth to improve burn multiple",
+            "rationale": "Revenue growth reduces net burn and improves unit economics",
+            "source": "Growth metrics"
+        },
+        {
+            "advice": "Benchmark burn against revenue milestones",
+            "rationale": "Efficient capital usage demonstrates to investors",
+            "source": "VC expectations"
+        }
+    ],
+    "default": [
+        {
+            "advice": "Diversify investments across asset classes",
+            "rationale": "Reduces risk through diversification",
+            "source": "Modern portfolio theory"
+        },
+        {
+            "advice": "Maintain emergency fund of 3-6 months expenses",
+            "rationale": "Provides financial cushion for unexpected events",
+            "source": "Personal finance basics"
+        },
+        {
+            "advice": "Invest for long-term, not short-term gains",
+            "rationale": "Long-term investing reduces volatility impact",
+            "source": "Investment fundamentals"
+        }
+    ]
+}
+
+
+@lru_cache(maxsize=64)
+def _build_curated_investment_options(
+    company_stage: str,
+    risk_tolerance: str
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    Build the curated investment options for a stage and risk tolerance.
+    
+    Results are cached per (company_stage, risk_tolerance); the option
+    dicts are shared between calls and must not be mutated.
+    
+    Args:
+        company_stage: Stage of company (seed, early, growth, mature)
+        risk_tolerance: Risk tolerance (conservative, moderate, aggressive)
+        
+    Returns:
+        Tuple of investment option dictionaries
+    """
+    # Base options available to all
+    options = []
+    
+    # High-yield savings accounts (conservative)
+    if risk_tolerance in ["conservative", "moderate"]:
+        options.append({
+            "name": "High-Yield Savings Account",
+            "type": "savings",
+            "risk_level": "very_low",
+            "expected_return": "4.5-5.0% APY",
+            "liquidity": "high",
+            "minimum": "$0",
+            "description": "FDIC-insured savings with competitive rates. Ideal for emergency funds and short-term reserves.",
+            "pros": ["No risk", "High liquidity", "FDIC insured"],
+            "cons": ["Lower returns", "Inflation risk"]
+        })
+    
+    # Money Market Funds
+    if risk_tolerance in ["conservative", "moderate"]:
+        options.append({
+            "name": "Money Market Funds",
+            "type": "money_market",
+            "risk_level": "low",
+            "expected_return": "5.0-5.5% APY",
+            "liquidity": "high",
+            "minimum": "$1,000",
+            "description": "Low-risk investment in short-term debt securities. Better returns than savings.",
+            "pros": ["Low risk", "Better than savings", "High liquidity"],
+            "cons": ["Not FDIC insured", "Market dependent"]
+        })
+    
+    # Treasury Bills (conservative to moderate)
+    options.append({
+        "name": "U.S. Treasury Bills",
+        "type": "treasury",
+        "risk_level": "very_low",
+        "expected_return": "4.5-5.5%",
+        "liquidity": "moderate",
+        "minimum": "$100",
+        "description": "Government-backed securities with guaranteed returns. Maturities from 4 weeks to 1 year.",
+        "pros": ["Government backed", "Predictable", "Tax advantages"],
+        "cons": ["Lower returns", "Time commitment"]
+    })
+    
+    # Corporate Bonds (moderate risk)
+    if risk_tolerance in ["moderate", "aggressive"]:
+        options.append({
+            "name": "Investment-Grade Corporate Bonds",
+            "type": "bonds",
+            "risk_level": "low_moderate",
+            "expected_return": "5.5-7.0%",
+            "liquidity": "moderate",
+            "minimum": "$1,000",
+            "description": "Bonds from stable corporations with strong credit ratings.",
+            "pros": ["Higher yields", "Regular income", "Diversification"],
+            "cons": ["Credit risk", "Interest rate risk", "Less liquid"]
+        })
+    
+    # Index Funds (moderate to aggressive)
+    if risk_tolerance in ["moderate", "aggressive"] and company_stage in ["growth", "mature"]:
+        options.append({
+            "name": "S&P 500 Index Funds",
+            "type": "equity_index",
+            "risk_level": "moderate",
+            "expected_return": "8-12% (historical avg)",
+            "liquidity": "high",
+            "minimum": "$0-$1,000",
+            "description": "Diversified exposure to 500 largest US companies. Long-term growth potential.",
+            "pros": ["High returns potential", "Diversified", "Low fees"],
+            "cons": ["Market volatility", "Not guaranteed", "Long-term horizon"]
+        })
+    
+    # Growth ETFs (aggressive)
+    if risk_tolerance == "aggressive" and company_stage in ["growth", "mature"]:
+        options.append({
+            "name": "Technology/Growth ETFs",
+            "type": "equity_etf",
+            "risk_level": "moderate_high",
+            "expected_return": "10-15%",
+            "liquidity": "high",
+            "minimum": "$0",
+            "description": "ETFs focused on high-growth sectors like technology and innovation.",
+            "pros": ["High growth potential", "Sector exposure", "Liquid"],
+            "cons": ["High volatility", "Sector concentration", "Market dependent"]
+        })
+    
+    # CDs (conservative, for mature companies)
+    if risk_tolerance == "conservative" and company_stage == "mature":
+        options.append({
+            "name": "Certificates of Deposit (CDs)",
+            "type": "cd",
+            "risk_level": "very_low",
+            "expected_return": "4.5-5.5%",
+            "liquidity": "low",
+            "minimum": "$500",
+            "description": "Fixed-term deposits with guaranteed returns. Terms from 3 months to 5 years.",
+            "pros": ["FDIC insured", "Guaranteed returns", "Predictable"],
+            "cons": ["Low liquidity", "Early withdrawal penalties", "Rate lock"]
+        })
+    
+    return tuple(options)
+
+
+@lru_cache(maxsize=2)
+def _build_market_trends(is_tech: bool) -> Tuple[Dict[str, Any], ...]:
+    """
+    Build the general market trend insights.
+    
+    Only the digital transformation relevance depends on the industry, so
+    there are two cached variants; the trend dicts are shared between calls
+    and must not be mutated.
+    
+    Args:
+        is_tech: Whether the industry is technology, software or SaaS
+        
+    Returns:
+        Tuple of trend dictionaries
+    """
+    # Provide general market insights
+    trends = [
+        {
+            "trend": "Rising interest rates",
+            "impact": "Higher returns on fixed-income investments",
+            "relevance": "high",
+            "timeframe": "2024-2025"
+        },
+        {
+            "trend": "Digital transformation acceleration",
+            "impact": "Increased focus on technology investments",
+            "relevance": "high" if is_tech else "moderate",
+            "timeframe": "ongoing"
+        },
+        {
+            "trend": "ESG investing growth",
+            "impact": "More focus on sustainable and responsible investments",
+            "relevance": "moderate",
+            "timeframe": "long-term"
+        }
+    ]
+    
+    return tuple(trends)
+
+
 class WebSearch:
     """
     Web search tool for researching investment options and market data.
@@ -309,108 +527,7 @@ class WebSearch:
         risk_tolerance: str
     ) -> List[Dict[str, Any]]:
         """Get curated investment recommendations based on stage and risk."""
-        
-        # Base options available to all
-        options = []
-        
-        # High-yield savings accounts (conservative)
-        if risk_tolerance in ["conservative", "moderate"]:
-            options.append({
-                "name": "High-Yield Savings Account",
-                "type": "savings",
-                "risk_level": "very_low",
-                "expected_return": "4.5-5.0% APY",
-                "liquidity": "high",
-                "minimum": "$0",
-                "description": "FDIC-insured savings with competitive rates. Ideal for emergency funds and short-term reserves.",
-                "pros": ["No risk", "High liquidity", "FDIC insured"],
-                "cons": ["Lower returns", "Inflation risk"]
-            })
-        
-        # Money Market Funds
-        if risk_tolerance in ["conservative", "moderate"]:
-            options.append({
-                "name": "Money Market Funds",
-                "type": "money_market",
-                "risk_level": "low",
-                "expected_return": "5.0-5.5% APY",
-                "liquidity": "high",
-                "minimum": "$1,000",
-                "description": "Low-risk investment in short-term debt securities. Better returns than savings.",
-                "pros": ["Low risk", "Better than savings", "High liquidity"],
-                "cons": ["Not FDIC insured", "Market dependent"]
-            })
-        
-        # Treasury Bills (conservative to moderate)
-        options.append({
-            "name": "U.S. Treasury Bills",
-            "type": "treasury",
-            "risk_level": "very_low",
-            "expected_return": "4.5-5.5%",
-            "liquidity": "moderate",
-            "minimum": "$100",
-            "description": "Government-backed securities with guaranteed returns. Maturities from 4 weeks to 1 year.",
-            "pros": ["Government backed", "Predictable", "Tax advantages"],
-            "cons": ["Lower returns", "Time commitment"]
-        })
-        
-        # Corporate Bonds (moderate risk)
-        if risk_tolerance in ["moderate", "aggressive"]:
-            options.append({
-                "name": "Investment-Grade Corporate Bonds",
-                "type": "bonds",
-                "risk_level": "low_moderate",
-                "expected_return": "5.5-7.0%",
-                "liquidity": "moderate",
-                "minimum": "$1,000",
-                "description": "Bonds from stable corporations with strong credit ratings.",
-                "pros": ["Higher yields", "Regular income", "Diversification"],
-                "cons": ["Credit risk", "Interest rate risk", "Less liquid"]
-            })
-        
-        # Index Funds (moderate to aggressive)
-        if risk_tolerance in ["moderate", "aggressive"] and company_stage in ["growth", "mature"]:
-            options.append({
-                "name": "S&P 500 Index Funds",
-                "type": "equity_index",
-                "risk_level": "moderate",
-                "expected_return": "8-12% (historical avg)",
-                "liquidity": "high",
-                "minimum": "$0-$1,000",
-                "description": "Diversified exposure to 500 largest US companies. Long-term growth potential.",
-                "pros": ["High returns potential", "Diversified", "Low fees"],
-                "cons": ["Market volatility", "Not guaranteed", "Long-term horizon"]
-            })
-        
-        # Growth ETFs (aggressive)
-        if risk_tolerance == "aggressive" and company_stage in ["growth", "mature"]:
-            options.append({
-                "name": "Technology/Growth ETFs",
-                "type": "equity_etf",
-                "risk_level": "moderate_high",
-                "expected_return": "10-15%",
-                "liquidity": "high",
-                "minimum": "$0",
-                "description": "ETFs focused on high-growth sectors like technology and innovation.",
-                "pros": ["High growth potential", "Sector exposure", "Liquid"],
-                "cons": ["High volatility", "Sector concentration", "Market dependent"]
-            })
-        
-        # CDs (conservative, for mature companies)
-        if risk_tolerance == "conservative" and company_stage == "mature":
-            options.append({
-                "name": "Certificates of Deposit (CDs)",
-                "type": "cd",
-                "risk_level": "very_low",
-                "expected_return": "4.5-5.5%",
-                "liquidity": "low",
-                "minimum": "$500",
-                "description": "Fixed-term deposits with guaranteed returns. Terms from 3 months to 5 years.",
-                "pros": ["FDIC insured", "Guaranteed returns", "Predictable"],
-                "cons": ["Low liquidity", "Early withdrawal penalties", "Rate lock"]
-            })
-        
-        return options
+        return list(_build_curated_investment_options(company_stage, risk_tolerance))
     
     def _get_market_trends(
         self,
@@ -419,29 +536,8 @@ class WebSearch:
     ) -> List[Dict[str, Any]]:
         """Get market trends for industry."""
         
-        # Provide general market insights
-        trends = [
-            {
-                "trend": "Rising interest rates",
-                "impact": "Higher returns on fixed-income investments",
-                "relevance": "high",
-                "timeframe": "2024-2025"
-            },
-            {
-                "trend": "Digital transformation acceleration",
-                "impact": "Increased focus on technology investments",
-                "relevance": "high" if industry.lower() in ["technology", "software", "saas"] else "moderate",
-                "timeframe": "ongoing"
-            },
-            {
-                "trend": "ESG investing growth",
-                "impact": "More focus on sustainable and responsible investments",
-                "relevance": "moderate",
-                "timeframe": "long-term"
-            }
-        ]
-        
-        return trends
+        is_tech = industry.lower() in ("technology", "software", "saas")
+        return list(_build_market_trends(is_tech))
     
     def _get_financial_advice(
         self,
@@ -450,68 +546,14 @@ class WebSearch:
     ) -> List[Dict[str, Any]]:
         """Get financial advice on topic."""
         
-        advice_database = {
-            "runway": [
-                {
-                    "advice": "Maintain 12-18 months of runway",
-                    "rationale": "Provides buffer for unexpected challenges and fundraising cycles",
-                    "source": "VC best practices"
-                },
-                {
-                    "advice": "Start fundraising at 6-9 months runway",
-                    "rationale": "Fundraising takes 3-6 months on average; don't wait until critical",
-                    "source": "Y Combinator guidance"
-                },
-                {
-                    "advice": "Track runway weekly",
-                    "rationale": "Early detection of problems allows for corrective action",
-                    "source": "CFO best practices"
-                }
-            ],
-            "burn_rate": [
-                {
-                    "advice": "Reduce burn rate when approaching critical runway",
-                    "rationale": "Preserve cash to extend runway and maintain operations",
-                    "source": "Financial management"
-                },
-                {
-                    "advice": "Focus on revenue growth to improve burn multiple",
-                    "rationale": "Revenue growth reduces net burn and improves unit economics",
-                    "source": "Growth metrics"
-                },
-                {
-                    "advice": "Benchmark burn against revenue milestones",
-                    "rationale": "Efficient capital usage demonstrates to investors",
-                    "source": "VC expectations"
-                }
-            ],
-            "default": [
-                {
-                    "advice": "Diversify investments across asset classes",
-                    "rationale": "Reduces risk through diversification",
-                    "source": "Modern portfolio theory"
-                },
-                {
-                    "advice": "Maintain emergency fund of 3-6 months expenses",
-                    "rationale": "Provides financial cushion for unexpected events",
-                    "source": "Personal finance basics"
-                },
-                {
-                    "advice": "Invest for long-term, not short-term gains",
-                    "rationale": "Long-term investing reduces volatility impact",
-                    "source": "Investment fundamentals"
-                }
-            ]
-        }
-        
         # Find relevant advice
         topic_lower = topic.lower()
         if "runway" in topic_lower:
-            return advice_database["runway"]
+            return list(_FINANCIAL_ADVICE["runway"])
         elif "burn" in topic_lower:
-            return advice_database["burn_rate"]
+            return list(_FINANCIAL_ADVICE["burn_rate"])
         else:
-            return advice_database["default"]
+            return list(_FINANCIAL_ADVICE["default"])
     
     async def close(self):
         """Close the HTTP client."""
@@ -0,0 +1,9 @@
+"""Shared utilities"""
+
+from app.utils.orjson_response import ORJSONResponse
+from app.utils.serialization import to_json
+
+__all__ = [
+    "ORJSONResponse",
+    "to_json"
+]
@@ -0,0 +1,21 @@
+"""orjson-backed JSON response for API handlers."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.utils.serialization import to_json
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    Handlers can return plain dicts containing Decimal, date/datetime and
+    numpy values without going through jsonable_encoder first.
+    """
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,47 @@
+"""orjson serialization shared by API responses, tools and services."""
+
+from collections import deque
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+# Naive datetimes are treated as UTC; NumPy arrays and scalars are native
+JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serialize types orjson does not handle natively.
+    
+    Args:
+        obj: Object orjson could not serialize
+        
+    Returns:
+        JSON-compatible representation
+    """
+    if isinstance(obj, Decimal):
+        # Keep full precision for money values
+        return str(obj)
+    if isinstance(obj, (deque, set, frozenset)):
+        # Session message histories are deques
+        return list(obj)
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def to_json(data: Any) -> bytes:
+    """
+    Serialize data to JSON bytes with orjson.
+    
+    Handles Decimal, date/datetime, NumPy values, dataclasses and deques,
+    so results from the tools and session services can be passed as-is.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        JSON-encoded bytes
+    """
+    return orjson.dumps(data, default=_default, option=JSON_OPTIONS)
@@ -3,8 +3,9 @@
 import pytest
 from datetime import date, datetime
 from decimal import Decimal
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload, sessionmaker
 
 from app.database import Base
 from app.models import Company, Transaction, TransactionType, AgentSession, AgentType
@@ -31,6 +32,7 @@ def test_create_company(db_session):
     )
     db_session.add(company)
     db_session.commit()
+    db_session.refresh(company, ["transactions"])
     
     assert company.id is not None
     assert company.name == "Test Startup"
@@ -80,6 +82,8 @@ def test_transaction_signed_amount(db_session):
         category="Expense",
         type=TransactionType.EXPENSE
     )
+    db_session.add_all([income, expense])
+    db_session.commit()
     
     assert income.signed_amount == 1000.00
     assert expense.signed_amount == -500.00
@@ -102,7 +106,7 @@ def test_company_transactions_relationship(db_session):
         db_session.add(transaction)
     
     db_session.commit()
-    db_session.refresh(company)
+    db_session.refresh(company, ["transactions"])
     
     assert len(company.transactions) == 3
     assert company.transaction_count == 3
@@ -148,11 +152,67 @@ def test_agent_session_relationship(db_session):
         db_session.add(session)
     
     db_session.commit()
-    db_session.refresh(company)
+    db_session.refresh(company, ["agent_sessions"])
     
     assert len(company.agent_sessions) == 2
 
 
+def test_company_relationships_not_loaded_implicitly(db_session):
+    """Test that company children must be loaded explicitly."""
+    company = Company(name="Test Company")
+    db_session.add(company)
+    db_session.commit()
+    db_session.expunge_all()
+    
+    loaded = db_session.scalars(select(Company)).one()
+    with pytest.raises(InvalidRequestError):
+        loaded.transactions
+    with pytest.raises(InvalidRequestError):
+        loaded.agent_sessions
+    
+    db_session.expunge_all()
+    loaded = db_session.scalars(
+        select(Company).options(selectinload(Company.transactions))
+    ).one()
+    assert loaded.transaction_count == 0
+
+
+@pytest.mark.parametrize("model", [Transaction, AgentSession])
+def test_company_not_loaded_implicitly(db_session, model):
+    """Test that a child's company must be loaded explicitly."""
+    company = Company(name="Test Company")
+    db_session.add(company)
+    db_session.commit()
+    
+    if model is Transaction:
+        child = Transaction(
+            company_id=company.id,
+            date=date.today(),
+            amount=Decimal("100.00"),
+            category="Test",
+            type=TransactionType.INCOME
+        )
+    else:
+        child = AgentSession(
+            company_id=company.id,
+            session_id="test_session_001",
+            agent_type=AgentType.FINANCIAL_ANALYST
+        )
+    db_session.add(child)
+    db_session.commit()
+    db_session.expunge_all()
+    
+    loaded = db_session.scalars(select(model)).one()
+    with pytest.raises(InvalidRequestError):
+        loaded.company
+    
+    db_session.expunge_all()
+    loaded = db_session.scalars(
+        select(model).options(selectinload(model.company))
+    ).one()
+    assert loaded.company.name == "Test Company"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -1,8 +1,11 @@
 """Unit tests for custom tools."""
 
+import io
 import pytest
+import pandas as pd
 from datetime import datetime, timedelta
-from app.tools.financial_calculator import financial_calculator
+from dateutil.relativedelta import relativedelta
+from app.tools.financial_calculator import TransactionTable, financial_calculator
 from app.tools.data_processor import data_processor
 from app.tools.chart_generator import chart_generator
 
@@ -96,6 +99,19 @@ class TestFinancialCalculator:
         assert result["runway_months"] == float('inf')
         assert result["status"] == "positive_cash_flow"
     
+    def test_calculate_runway_vec(self):
+        """Test vectorized runway matches the scalar calculation."""
+        result = financial_calculator.calculate_runway_vec(
+            [100000.0, 20000.0, 100000.0],
+            [10000.0, 10000.0, -5000.0]
+        )
+        
+        assert list(result["status"]) == ["healthy", "critical", "positive_cash_flow"]
+        assert result["runway_months"][0] == 10.0
+        assert result["runway_months"][2] == float('inf')
+        assert str(result["estimated_depletion_date"][0]) == \
+            financial_calculator.calculate_runway(100000.0, 10000.0)["estimated_depletion_date"]
+    
     def test_analyze_spending_by_category(self, sample_transactions):
         """Test spending analysis by category."""
         result = financial_calculator.analyze_spending_by_category(
@@ -130,6 +146,36 @@ class TestFinancialCalculator:
         assert result["current_balance"] == 115000.0
         assert result["balance_status"] == "positive"
     
+    def test_transaction_table_input(self, sample_transactions):
+        """Test calculators accept a prebuilt TransactionTable."""
+        table = TransactionTable.from_dicts(sample_transactions)
+        
+        assert len(table) == len(sample_transactions)
+        assert financial_calculator.calculate_burn_rate(table, 3) == \
+            financial_calculator.calculate_burn_rate(sample_transactions, 3)
+        assert financial_calculator.analyze_spending_by_category(table) == \
+            financial_calculator.analyze_spending_by_category(sample_transactions)
+        assert financial_calculator.calculate_balance(100000.0, table)["current_balance"] == 115000.0
+    
+    def test_list_edits_are_not_cached(self, sample_transactions):
+        """Test editing a transaction list in place changes the next result."""
+        assert financial_calculator.calculate_balance(100000.0, sample_transactions)["current_balance"] == 115000.0
+        assert financial_calculator.analyze_spending_by_category(sample_transactions)["total_expenses"] == 135000.0
+        
+        sample_transactions[1]["amount"] = 31000.0
+        assert financial_calculator.calculate_balance(100000.0, sample_transactions)["current_balance"] == 114000.0
+        assert financial_calculator.analyze_spending_by_category(sample_transactions)["total_expenses"] == 136000.0
+    
+    def test_table_results_are_cached_copies(self, sample_transactions):
+        """Test results memoized on a TransactionTable are returned as copies."""
+        table = TransactionTable.from_dicts(sample_transactions)
+        first = financial_calculator.analyze_spending_by_category(table)
+        first["categories"].clear()
+        second = financial_calculator.analyze_spending_by_category(table)
+        
+        assert second == financial_calculator.analyze_spending_by_category(sample_transactions)
+        assert second["categories"]
+    
     def test_calculate_growth_rate(self, sample_transactions):
         """Test growth rate calculation."""
         result = financial_calculator.calculate_growth_rate(
@@ -159,6 +205,43 @@ class TestFinancialCalculator:
         # Score should be good with 12 months runway and positive growth
         assert result["health_score"] >= 60
         assert result["rating"] in ["Good", "Excellent"]
+    
+    def test_calculate_financial_health_score_batch(self):
+        """Test batch health scores match the scalar calculation."""
+        scenarios = [
+            (120000.0, 10000.0, 15.0, 5.0),
+            (20000.0, 10000.0, -5.0, 40.0),
+            (50000.0, -2000.0, 25.0, 30.0),
+            # NaN inputs fall in the top bucket on every path
+            (float("nan"), 10000.0, 15.0, 5.0),
+            (120000.0, 10000.0, float("nan"), float("nan"))
+        ]
+        batch = financial_calculator.calculate_financial_health_score_batch(*zip(*scenarios))
+        
+        for i, scenario in enumerate(scenarios):
+            result = financial_calculator.calculate_financial_health_score(*scenario)
+            assert batch["health_score"][i] == result["health_score"]
+            assert batch["rating"][i] == result["rating"]
+    
+    def test_calculate_dashboard(self, sample_transactions):
+        """Test the combined dashboard matches the individual calculations."""
+        result = financial_calculator.calculate_dashboard(
+            sample_transactions,
+            current_balance=115000.0
+        )
+        
+        burn_rate = financial_calculator.calculate_burn_rate(sample_transactions, 3)
+        assert result["burn_rate"] == burn_rate
+        assert result["runway"]["status"] == "positive_cash_flow"
+        assert result["income_growth"] == \
+            financial_calculator.calculate_growth_rate(sample_transactions, "income", 6)
+        assert result["health_score"]["health_score"] == \
+            financial_calculator.calculate_financial_health_score(
+                115000.0,
+                burn_rate["burn_rate"],
+                result["income_growth"]["growth_rate"],
+                result["expense_growth"]["growth_rate"]
+            )["health_score"]
 
 
 class TestDataProcessor:
@@ -187,6 +270,23 @@ class TestDataProcessor:
         assert result["success"] is False
         assert "Missing required columns" in result["error"]
     
+    def test_parse_csv_trailing_commas(self):
+        """Test rows with a trailing comma keep their columns."""
+        csv_content = """date,amount,category,type
+2024-01-15,100,Salaries,expense,
+2024-01-16,200,Revenue,income,
+"""
+        
+        result = data_processor.parse_csv(csv_content, company_id=1)
+        
+        assert result["success"] is True
+        assert result["valid_rows"] == 2
+        assert result["transactions"][0]["date"].startswith("2024-01-15")
+        assert result["transactions"][1]["amount"] == 200.0
+        
+        chunks = list(data_processor.parse_csv_iter(csv_content, company_id=1, chunk_size=1))
+        assert [chunk["valid_rows"] for chunk in chunks] == [1, 1]
+    
     def test_parse_csv_invalid_date(self):
         """Test parsing CSV with invalid date."""
         csv_content = """date,amount,category,type,description
@@ -197,6 +297,32 @@ invalid-date,1500.00,Salaries,expense,Test"""
         assert result["success"] is False
         assert result["invalid_rows"] == 1
     
+    def test_parse_csv_as_records(self):
+        """Test parsing CSV into TransactionRecord objects."""
+        csv_content = """date,amount,category,type,description
+2024-01-15,1500.00,Salaries,expense,Employee payroll
+2024-01-20,5000.00,Revenue,income,Customer payment"""
+        
+        records = data_processor.parse_csv(csv_content, company_id=1, as_records=True)
+        dicts = data_processor.parse_csv(csv_content, company_id=1)
+        
+        assert records["valid_rows"] == 2
+        assert records["transactions"][0].amount == 1500.0
+        assert [t.to_dict() for t in records["transactions"]] == dicts["transactions"]
+    
+    def test_parse_csv_iter_chunks(self):
+        """Test streaming CSV parsing in chunks."""
+        csv_content = io.StringIO("""date,amount,category,type,description
+2024-01-15,1500.00,Salaries,expense,Employee payroll
+invalid-date,1500.00,Salaries,expense,Test
+2024-01-20,5000.00,Revenue,income,Customer payment""")
+        
+        chunks = list(data_processor.parse_csv_iter(csv_content, company_id=1, chunk_size=2))
+        
+        assert len(chunks) == 2
+        assert [c["valid_rows"] for c in chunks] == [1, 1]
+        assert chunks[0]["errors"][0]["row"] == 3
+    
     def test_parse_date_formats(self):
         """Test parsing different date formats."""
         # YYYY-MM-DD format
@@ -231,6 +357,14 @@ invalid-date,1500.00,Salaries,expense,Test"""
         result4 = data_processor.validate_amount("invalid")
         assert result4["valid"] is False
     
+    def test_validate_amount_series(self):
+        """Test vectorized amount validation."""
+        values, valid = data_processor.validate_amount_series(
+            pd.Series(["1500.00", "$1,500.00", "-100", "invalid", "1000000000"])
+        )
+        assert values[:2].tolist() == [1500.0, 1500.0]
+        assert valid.tolist() == [True, True, False, False, False]
+    
     def test_clean_transactions(self):
         """Test transaction cleaning."""
         transactions = [
@@ -277,6 +411,20 @@ invalid-date,1500.00,Salaries,expense,Test"""
         assert result["transaction_count"] == 2
         assert len(result["issues"]) == 0
     
+    def test_validate_batch_duplicates(self):
+        """Test duplicate detection compares key fields, not joined strings."""
+        transactions = [
+            {"company_id": 1, "date": "2024-01-01", "amount": 10.0, "category": "Rent", "type": "expense"},
+            {"company_id": 1, "date": "2024-01-01", "amount": 10.0, "category": "Rent", "type": "expense"},
+            {"company_id": 1, "date": "2024-01-01", "amount": 10.0, "category": "Rent_Office", "type": "expense"},
+            {"company_id": 1, "date": "2024-01-01", "amount": "10.0_Rent", "category": "Office", "type": "expense"}
+        ]
+        
+        result = data_processor.validate_batch(transactions)
+        
+        duplicates = [w for w in result["warnings"] if w.startswith("Potential duplicate")]
+        assert duplicates == ["Potential duplicate: 2024-01-01_10.0_Rent"]
+    
     def test_generate_summary_statistics(self):
         """Test summary statistics generation."""
         transactions = [
@@ -348,6 +496,36 @@ class TestChartGenerator:
         assert "expenses" in data_point
         assert "burn_rate" in data_point
     
+    def test_burn_rate_chart_columnar(self, sample_transactions):
+        """Test columnar burn rate output matches the per-month rows."""
+        rows = chart_generator.generate_burn_rate_chart(sample_transactions, months=6)
+        columns = chart_generator.generate_burn_rate_chart(
+            sample_transactions, months=6, columnar=True
+        )
+        
+        assert columns["months"] == rows["months"]
+        assert set(columns["data"]) == set(rows["data"][0])
+        for i, point in enumerate(rows["data"]):
+            assert {key: values[i] for key, values in columns["data"].items()} == point
+    
+    def test_burn_rate_chart_includes_whole_first_month(self):
+        """Test the lookback window starts at a calendar month boundary."""
+        first_day = (datetime.utcnow() - relativedelta(months=2)).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        transactions = [{
+            "date": first_day.isoformat(),
+            "amount": 100.0,
+            "type": "expense",
+            "category": "Rent"
+        }]
+        
+        result = chart_generator.generate_burn_rate_chart(transactions, months=2)
+        
+        assert len(result["data"]) == 1
+        assert result["data"][0]["month"] == first_day.strftime("%Y-%m")
+        assert result["data"][0]["expenses"] == 100.0
+    
     def test_generate_category_breakdown_chart(self, sample_transactions):
         """Test category breakdown chart generation."""
         result = chart_generator.generate_category_breakdown_chart(
@@ -385,6 +563,20 @@ class TestChartGenerator:
         assert "balance" in data_point
         assert "is_projected" in data_point
     
+    def test_generate_forecast_series(self):
+        """Test column-wise forecast series generation."""
+        result = chart_generator.generate_forecast_series(
+            current_balance=100000.0,
+            monthly_income=5000.0,
+            monthly_expenses=15000.0,
+            forecast_months=12
+        )
+        
+        assert len(result["months"]) == 13  # 12 forecast + current month
+        assert len(result["balance"]) == len(result["income"]) == len(result["expenses"]) == 13
+        assert result["balance"][0] == 100000.0
+        assert result["balance"][-1] == pytest.approx(-20000.0)
+    
     def test_generate_balance_history_chart(self, sample_transactions):
         """Test balance history chart generation."""
         result = chart_generator.generate_balance_history_chart(
@@ -431,6 +623,27 @@ class TestChartGenerator:
         assert "balance_history" in result
         assert "income_trend" in result
         assert "expense_trend" in result
+    
+    def test_combined_dashboard_data_is_cached(self, sample_transactions):
+        """Test repeated dashboard requests reuse the cached result."""
+        first = chart_generator.generate_combined_dashboard_data(
+            initial_capital=100000.0,
+            transactions=sample_transactions,
+            months=6
+        )
+        second = chart_generator.generate_combined_dashboard_data(
+            initial_capital=100000.0,
+            transactions=list(sample_transactions),
+            months=6
+        )
+        other = chart_generator.generate_combined_dashboard_data(
+            initial_capital=50000.0,
+            transactions=sample_transactions,
+            months=6
+        )
+        
+        assert second is first
+        assert other is not first
 
 
 @pytest.mark.asyncio